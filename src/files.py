@@ -5,36 +5,108 @@ default values in the schemas.
 """
 
 
-import io
+from __future__ import annotations
+import contextlib
+import copy
+import functools
 import json
 import os
 import pathlib
 import sys
+import threading
 import typing
 
+import ijson
 import jsonschema
+import numpy as np
+import numpy.typing as npt
 import referencing
 
 
+# The number of bytes that are buffered before being read from or written to
+# a file.
+_BUFFER_SIZE = 1 << 17
+
+
+def _blank_number(schema: dict) -> float:
+    """Return the smallest number allowed by a ``number`` schema,
+    or 0 if it is unbounded.
+    """
+    if 'minimum' in schema:
+        return schema['minimum']
+
+    if 'exclusiveMinimum' in schema:
+        return schema['exclusiveMinimum'] + 1.0
+
+    return 0.0
+
+
+def _blank_integer(schema: dict) -> int:
+    """Return the smallest integer allowed by an ``integer`` schema,
+    or 0 if it is unbounded.
+    """
+    if 'minimum' in schema:
+        return schema['minimum']
+
+    if 'exclusiveMinimum' in schema:
+        return schema['exclusiveMinimum'] + 1
+
+    return 0
+
+
+def _find_refs(schema: typing.Any) -> typing.Iterator[str]:
+    """Yield the URI of every schema file referenced by ``$ref`` in `schema`,
+    without any fragment. References within `schema` itself are skipped.
+    """
+    pending = [schema]
+
+    while pending:
+        node = pending.pop()
+
+        if isinstance(node, dict):
+            uri = node.get('$ref')
+            if isinstance(uri, str) and not uri.startswith('#'):
+                yield uri.partition('#')[0]
+
+            pending.extend(node.values())
+
+        elif isinstance(node, list):
+            pending.extend(node)
+
+
+# The functions that generate the default values of schema types
+# that do not contain other values.
+_LEAF_FACTORIES: dict[str, typing.Callable[[dict], typing.Any]] = {
+    'string': lambda schema: '',
+    'number': _blank_number,
+    'integer': _blank_integer,
+    'boolean': lambda schema: False,
+    'null': lambda schema: None
+}
+
+
 class FileHandler:
     """Class of attributes and methods to create, read, and write to files.
 
     Parameters
     ----------
-    `schema_file` : `str`, default="schema.json"
+    `schema_file` : `str`, default="main.json"
         The name of the JSON schema file used for the input files.
 
         The file name will automatically be resolved with respect to
-        :attr:`FileHandler.INPUT_DIR`,
+        :attr:`FileHandler.SCHEMA_DIR`,
         so it should not include the directory at the beginning.
         Best to keep it to the default unless you want to write an entire custom
         JSON schema.
-    `input_file` : `str`, default="sample.csv"
+    `input_filepath` : `str`, default="sample.json"
         The filepath of the input file, including file extension.
 
         Accepts both with and without the directory.
         The output file will have the same name
         but with the ".txt" file extension instead.
+    `dtype` : :class:`numpy.typing.DTypeLike`, default=numpy.float64
+        The data type used to store the positions and velocities of the
+        particles that are read from the input file.
 
     Attributes
     ----------
@@ -45,83 +117,375 @@ class FileHandler:
         used for JSON formatting.
     `OUTPUT_DIR` : :class:`pathlib.Path`
         Static path representing the directory that contains the output files.
+    `PRECISION_DTYPES` : :py:class:`dict` [`str`, :class:`numpy.dtype`]
+        Static mapping from the values of the ``precision`` property of the
+        input files to the data types that they represent.
     `INPUT_FILE_PATH` : `str`
         A string that stores the path of the input file.
     `INPUT_DATA` : `Any`
         The object that is stored in the file specified by
-        :attr:`INPUT_FILE_PATH`.
+        :attr:`INPUT_FILE_PATH`. It is only read the first time that it is
+        accessed, so prefer :meth:`read_input_metadata` and
+        :meth:`iter_particles` for large input files.
     `OUTPUT_FILE_PATH` : `str`
         A string that stores the path of the output file.
-
-    Raises
-    ------
-    :exc:`OSError`
-        If ``schema_file`` can not be read or its formatting is incorrect.
+    `DTYPE` : :class:`numpy.dtype`
+        The data type used to store the positions and velocities of the
+        particles that are read from the input file.
+    `SCHEMA` : :py:class:`dict`
+        The JSON schema that the input files must conform to.
+        It is only read from ``schema_file`` the first time that it is
+        accessed.
     """
 
     INPUT_DIR = pathlib.Path('./input')
     SCHEMA_DIR = pathlib.Path('./schemas')
     OUTPUT_DIR = pathlib.Path('./output')
+    PRECISION_DTYPES = {
+        'single': np.dtype(np.float32),
+        'double': np.dtype(np.float64)
+    }
+
+    # Instances shared through `FileHandler.get()`.
+    _instances: dict[tuple, FileHandler] = {}
+
+    # Schema files retrieved by `FileHandler.retrieve_schema_file()`,
+    # keyed by their resolved paths.
+    _schema_resources: dict[pathlib.Path, referencing.Resource] = {}
+
+    # Held while a schema file is read into `FileHandler._schema_resources`,
+    # so that handlers on different threads do not parse it twice.
+    _schema_resources_lock = threading.RLock()
+
+    # The registry that every validator retrieves referenced schema files
+    # through. It is created once the class has been defined.
+    _registry: referencing.Registry
+
+    # Compiled validators, keyed by the serialized JSON of their schemas,
+    # so that handlers for the same schema share them.
+    _validators: dict[str, jsonschema.Draft202012Validator] = {}
 
     @typing.override
     def __init__(
         self,
         schema_file: str = 'main.json',
-        input_filepath: str = 'sample.json'
+        input_filepath: str = 'sample.json',
+        dtype: npt.DTypeLike = np.float64
     ) -> None:
 
+        input_path = pathlib.Path(input_filepath)
+
         # If the filepath does not include input/, add it.
-        self.INPUT_FILE_PATH = pathlib.Path(
-            input_filepath if os.path.dirname(input_filepath) == 'input'
-            else self.INPUT_DIR / input_filepath
+        self.INPUT_FILE_PATH = (
+            input_path if input_path.parts[:1] == FileHandler.INPUT_DIR.parts
+            else FileHandler.INPUT_DIR / input_path
+        )
+
+        # The output file has the same name as input_file but with the '.txt'
+        # extension.
+        self.OUTPUT_FILE_PATH = (
+            FileHandler.OUTPUT_DIR / (input_path.stem + '.txt')
         )
 
-        # Try to read the file data.
-        # If it fails to read, temporarily store an empty dict.
+        # The raw file descriptor of the output file while it is open,
+        # and the encoded strings waiting to be written to it.
+        self.__output_fd: int | None = None
+        self.__output_buffer: list[bytes] = []
+        self.__output_buffer_size = 0
+
+        self.DTYPE = np.dtype(dtype)
+
+        # The schema is only read and compiled the first time it is needed.
+        self.__schema_file = schema_file
+
+        # The template generated from the schema, once it is first needed.
+        self.__json_template: dict | None = None
+
+    @classmethod
+    def get(
+        cls,
+        schema_file: str = 'main.json',
+        input_filepath: str = 'sample.json',
+        dtype: npt.DTypeLike = np.float64
+    ) -> FileHandler:
+        """Return a shared :class:`FileHandler` for the given arguments,
+        only creating a new one the first time that they are used.
+
+        Useful when many handlers are needed for the same files, e.g., in
+        batch runs, since the schema is then only read once.
+
+        Parameters
+        ----------
+        `schema_file` : `str`, default="main.json"
+            The name of the JSON schema file used for the input files.
+        `input_filepath` : `str`, default="sample.json"
+            The filepath of the input file, including file extension.
+        `dtype` : :class:`numpy.typing.DTypeLike`, default=numpy.float64
+            The data type used to store the positions and velocities of the
+            particles that are read from the input file.
+
+        Returns
+        -------
+        :class:`FileHandler`
+            The shared :class:`FileHandler` for the given arguments.
+        """
+        key = (schema_file, input_filepath, np.dtype(dtype))
+
+        if key not in cls._instances:
+            cls._instances[key] = cls(schema_file, input_filepath, dtype)
+
+        return cls._instances[key]
+
+    @functools.cached_property
+    def SCHEMA(self) -> dict:
+        """Read the schema file in one call and parse it.
+        It is only read the first time that any :class:`FileHandler`
+        accesses it, so handlers for the same schema file share the same
+        :py:class:`dict`, which should not be modified.
+
+        Returns
+        -------
+        :py:class:`dict`
+            The JSON schema that the input files must conform to.
+
+        Raises
+        ------
+        :exc:`OSError`
+            If the schema file can not be read.
+        """
+        return self.retrieve_schema_file(self.__schema_file).contents
+
+    @functools.cached_property
+    def __validator(self) -> jsonschema.Draft202012Validator:
+        """Look up the validator for :attr:`SCHEMA` once,
+        rather than every time that a dict is validated.
+
+        Returns
+        -------
+        :class:`jsonschema.Draft202012Validator`
+            The validator for :attr:`SCHEMA`.
+        """
+        return self.get_validator(self.SCHEMA)
+
+    @functools.cached_property
+    def INPUT_DATA(self) -> typing.Any:
+        """Read the entire input file into memory.
+        If the input file does not exist, an empty :py:class:`dict` is used
+        instead.
+
+        Returns
+        -------
+        `Any`
+            The object that is stored in :attr:`INPUT_FILE_PATH`.
+        """
         try:
-            with open(self.INPUT_FILE_PATH) as file:
-                self.INPUT_DATA = json.load(file)
+            return json.loads(self.INPUT_FILE_PATH.read_bytes())
 
         except FileNotFoundError:
-            self.INPUT_DATA = {}
+            return {}
 
-        # The output file has the same name as input_file but with the '.txt'
-        # extension.
-        self.OUTPUT_FILE_PATH = pathlib.Path(
-            FileHandler.OUTPUT_DIR /
-            (pathlib.Path(input_filepath).stem + '.txt')
-        )
+    def read_input_metadata(self) -> dict:
+        """Read every top-level property of the input file except for the
+        particles, without ever holding the particles in memory.
+
+        Returns
+        -------
+        :py:class:`dict`
+            The top-level properties of the input file, excluding
+            ``particles``.
+
+        Raises
+        ------
+        :exc:`OSError`
+            If :attr:`INPUT_FILE_PATH` can not be read.
+        :exc:`ijson.JSONError`
+            If the input file is not a properly formatted JSON.
+        """
+        metadata = {}
+
+        # The property currently being built and its builder.
+        # When the property is the particles, the builder is `None`.
+        key = None
+        builder = None
+
+        # ijson reads the file in blocks of its own,
+        # so it does not need to be buffered a second time.
+        with self.INPUT_FILE_PATH.open('rb', buffering=0) as file:
+            for prefix, event, value in ijson.parse(
+                file, buf_size=_BUFFER_SIZE, use_float=True
+            ):
+                # Reached the next top-level property (or the end of the object),
+                # so store the property that was just finished.
+                if prefix == '' and event in ('map_key', 'end_map'):
+                    if builder is not None:
+                        metadata[key] = builder.value
+
+                    key = value
+                    builder = (
+                        ijson.ObjectBuilder() if key != 'particles' else None
+                    )
+
+                elif builder is not None:
+                    builder.event(event, value)
+
+        return metadata
+
+    def iter_particles(self) -> typing.Iterator[dict]:
+        """Stream the particles of the input file one at a time, so that the
+        full list of particles never has to be held in memory.
+
+        Yields
+        ------
+        :py:class:`dict`
+            The next particle in the input file.
+
+        Raises
+        ------
+        :exc:`OSError`
+            If :attr:`INPUT_FILE_PATH` can not be read.
+        :exc:`ijson.JSONError`
+            If the input file is not a properly formatted JSON.
+        """
+        # ijson reads the file in blocks of its own,
+        # so it does not need to be buffered a second time.
+        with self.INPUT_FILE_PATH.open('rb', buffering=0) as file:
+            yield from ijson.items(
+                file, 'particles.item', buf_size=_BUFFER_SIZE, use_float=True
+            )
+
+    def read_particle_arrays(
+        self,
+        dtype: npt.DTypeLike | None = None
+    ) -> dict[str, np.ndarray]:
+        """Read the particles of the input file into NumPy arrays, with one
+        array per property rather than one :py:class:`dict` per particle.
 
-        self.__output_io_wrapper: io.TextIOWrapper | None = None
+        Each particle is validated against the particle schema as it is
+        streamed by :meth:`iter_particles`. The arrays are built from the
+        ``position``, ``velocity``, ``mass``, and ``charge`` properties of each
+        particle. If ``position``, ``velocity``, or ``charge`` is missing, it
+        defaults to 0.
 
-        # Open the schema file and read it.
-        with open(FileHandler.SCHEMA_DIR / schema_file) as file:
-            self.SCHEMA = json.load(file)
+        Parameters
+        ----------
+        `dtype` : :class:`numpy.typing.DTypeLike`, optional
+            The data type of the position and velocity arrays.
+            If ``None``, defaults to :attr:`DTYPE`.
+
+        Returns
+        -------
+        :py:class:`dict` [`str`, :class:`numpy.ndarray`]
+            A :py:class:`dict` with the keys ``positions`` and ``velocities``,
+            which are N × 3 arrays, and ``masses`` and ``charges``, which are
+            arrays of length N, where N is the number of particles.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If a particle does not conform to the particle schema.
+        """
+        if dtype is None:
+            dtype = self.DTYPE
+
+        # Look up the validator once rather than for every particle.
+        particle_is_valid = self.get_validator(
+            self.SCHEMA['properties']['particles']['items']
+        ).is_valid
+
+        # Each particle is packed into one record of this type,
+        # so that the particles are written straight into a single buffer.
+        record_dtype = np.dtype([
+            ('position', dtype, 3),
+            ('velocity', dtype, 3),
+            ('mass', np.float64),
+            ('charge', np.float64)
+        ])
+
+        def iter_records() -> typing.Iterator[tuple]:
+            # Close the input file as soon as reading stops,
+            # even if a particle is invalid,
+            # rather than whenever the generator is garbage collected.
+            with contextlib.closing(self.iter_particles()) as particles:
+                for particle in particles:
+                    if not particle_is_valid(particle):
+                        raise ValueError(
+                            f'The particle {particle} does not conform to the '
+                            'JSON schema.'
+                        )
+
+                    yield (
+                        particle.get('position', (0.0, 0.0, 0.0)),
+                        particle.get('velocity', (0.0, 0.0, 0.0)),
+                        particle['mass'],
+                        particle.get('charge', 0.0)
+                    )
+
+        records = np.fromiter(iter_records(), dtype=record_dtype)
+
+        # Split the records into one contiguous array per property.
+        return {
+            'positions': np.ascontiguousarray(records['position']),
+            'velocities': np.ascontiguousarray(records['velocity']),
+            'masses': np.ascontiguousarray(records['mass']),
+            'charges': np.ascontiguousarray(records['charge'])
+        }
 
     def open_output_file(self) -> None:
-        """Open an :class:`io.TextIOWrapper` for :attr:`OUTPUT_FILE_PATH`.
-        Should be closed by :meth:`clear_output_file` after done writing to it.
+        """Open a raw, append-only file descriptor for :attr:`OUTPUT_FILE_PATH`,
+        creating the file if it does not exist.
+        Should be closed by :meth:`close_output_file` after done writing to it.
 
         Raises
         ------
         :exc:`OSError`
             If :attr:`OUTPUT_FILE_PATH` does not point to an accessible file.
         """
-        self.__output_io_wrapper = self.OUTPUT_FILE_PATH.open('a')
+        self.__output_fd = os.open(
+            self.OUTPUT_FILE_PATH,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+            0o644
+        )
 
-    def close_output_file(self) -> None:
-        """Close the attribute the internal file for :attr:`OUTPUT_FILE_PATH`.
+    def flush_output_file(self) -> None:
+        """Write everything that has been buffered by
+        :meth:`append_to_output_file` into the output file.
         If it is not open, nothing happens.
+
+        Raises
+        ------
+        :exc:`OSError`
+            If the output file is not writeable.
+        """
+        if self.__output_fd is None or not self.__output_buffer:
+            return
+
+        data = memoryview(b''.join(self.__output_buffer))
+        self.__output_buffer.clear()
+        self.__output_buffer_size = 0
+
+        # `os.write()` may write fewer bytes than given.
+        while data:
+            data = data[os.write(self.__output_fd, data):]
+
+    def close_output_file(self) -> None:
+        """Flush and close the internal file descriptor for
+        :attr:`OUTPUT_FILE_PATH`. If it is not open, nothing happens.
         """
-        # Check if the TextIOWrapper exists.
+        # Check if the file descriptor exists.
         # If not, the operation fails.
-        if self.__output_io_wrapper != None:
-            self.__output_io_wrapper.close()
+        if self.__output_fd is not None:
+            try:
+                self.flush_output_file()
+
+            finally:
+                os.close(self.__output_fd)
+                self.__output_fd = None
 
     def append_to_output_file(self, output_string: str = '\n') -> None:
         """Append the given string into the output file.
         If :attr:`OUTPUT_FILE_PATH` has already been opened,
-        then the string will be appended to it without closing.
+        then the string will be buffered in memory and written in blocks of
+        at least 128 KiB, or when the file is flushed or closed.
 
         Elsewise, it will open :attr:`OUTPUT_FILE_PATH`, append to it, and
         close it.
@@ -137,32 +501,69 @@ class FileHandler:
         :exc:`OSError`
             If the output file is not writeable.
         """
-        # If the output file has already been used, use it.
-        if self.__output_io_wrapper == None:
-            with self.OUTPUT_FILE_PATH.open('a') as file:
+        # If the output file has not been opened, write to it directly.
+        if self.__output_fd is None:
+            with self.OUTPUT_FILE_PATH.open(
+                'a', buffering=_BUFFER_SIZE
+            ) as file:
                 file.write(output_string)
 
+        # Else, buffer the string until there is enough to write at once.
         else:
-            self.__output_io_wrapper.write(output_string)
+            data = output_string.encode()
+            self.__output_buffer.append(data)
+            self.__output_buffer_size += len(data)
+
+            if self.__output_buffer_size >= _BUFFER_SIZE:
+                self.flush_output_file()
 
     def clear_output_file(self) -> None:
-        """Clear the output file.
+        """Clear the output file, including anything that has been buffered
+        but not written yet.
 
         Raises
         ------
         :exc:`OSError`
             If the output file is not writeable.
         """
-        # If the output file has already been used, use it.
-        if self.__output_io_wrapper is None:
-            self.OUTPUT_FILE_PATH.write_text('')
+        self.__output_buffer.clear()
+        self.__output_buffer_size = 0
 
-        else:
-            self.__output_io_wrapper.truncate(0)
+        # If the output file has already been opened, truncate it directly.
+        if self.__output_fd is not None:
+            os.ftruncate(self.__output_fd, 0)
+            return
 
-    def retrieve_schema_file(self, uri: str) -> referencing.Resource:
+        # Else, truncate it by its path, creating it if it does not exist.
+        try:
+            os.truncate(self.OUTPUT_FILE_PATH, 0)
+
+        except FileNotFoundError:
+            self.OUTPUT_FILE_PATH.touch()
+
+    def __enter__(self) -> typing.Self:
+        """Open the output file with :meth:`open_output_file`.
+
+        Returns
+        -------
+        :class:`FileHandler`
+            This :class:`FileHandler`.
+        """
+        self.open_output_file()
+        return self
+
+    def __exit__(self, *exc_info: typing.Any) -> None:
+        """Flush and close the output file with :meth:`close_output_file`."""
+        self.close_output_file()
+
+    @classmethod
+    def retrieve_schema_file(cls, uri: str) -> referencing.Resource:
         """Retrieve the contents of a given JSON file as a Python object.
 
+        Each file is only read and parsed once. Afterwards, the same
+        :class:`referencing.Resource` is returned by every
+        :class:`FileHandler`.
+
         Parameters
         ----------
         `uri` : `str`
@@ -174,10 +575,22 @@ class FileHandler:
         :class:`referencing.Resource`
             The contents of the JSON file as a Python object.
         """
-        pathlib.Path = self.SCHEMA_DIR / uri
-        contents = json.loads(pathlib.Path.read_text())
+        # Resolve the path so that different URIs for the same file share it.
+        path = (cls.SCHEMA_DIR / uri).resolve()
+
+        resource = cls._schema_resources.get(path)
+        if resource is not None:
+            return resource
+
+        with cls._schema_resources_lock:
+            if path not in cls._schema_resources:
+                cls._schema_resources[path] = (
+                    referencing.Resource.from_contents(
+                        json.loads(path.read_bytes())
+                    )
+                )
 
-        return referencing.Resource.from_contents(contents)
+            return cls._schema_resources[path]
 
     def validate_input_dict(
         self,
@@ -198,25 +611,78 @@ class FileHandler:
         -------
             Whether the given dictionary conforms to :attr:`SCHEMA`.
         """
-        # If no schema is passed in, default to self.json_schema.
-        schema_dict = self.SCHEMA if schema is None else schema
+        return self.get_validator(schema).is_valid(input_dict)
 
-        # Create registry that retrieves all necessary files.
-        registry = referencing.Registry(retrieve=self.retrieve_schema_file)
+    def get_validator(
+        self,
+        schema: dict | None = None
+    ) -> jsonschema.Draft202012Validator:
+        """Return the compiled validator for the given schema,
+        only compiling it the first time that any handler uses the schema.
 
-        # Validate the input dict using the schema and registry.
-        validator = jsonschema.Draft202012Validator(
-            schema=schema_dict, registry=registry
-        )
+        Useful when many dicts are validated against the same schema,
+        since the lookup can then be done once outside of the loop.
 
-        try:
-            validator.validate(input_dict)
-            return True
+        Parameters
+        ----------
+        `schema` : :py:class:`dict`, optional
+            The JSON schema or schema property to validate with.
+            If ``None``, defaults to :attr:`SCHEMA`.
+
+        Returns
+        -------
+        :class:`jsonschema.Draft202012Validator`
+            The validator for `schema`.
+        """
+        # If no schema is passed in, default to the validator for self.SCHEMA.
+        if schema is None:
+            return self.__validator
+
+        # Else, compile a validator for the schema the first time it is used.
+        key = json.dumps(schema, sort_keys=True)
+
+        if key not in FileHandler._validators:
+            FileHandler._validators[key] = jsonschema.Draft202012Validator(
+                schema=schema, registry=self.preload_schema_files(schema)
+            )
+
+        return FileHandler._validators[key]
+
+    @classmethod
+    def preload_schema_files(cls, schema: dict) -> referencing.Registry:
+        """Retrieve every schema file that is referenced by the given schema,
+        directly or through other schema files, ahead of time.
+
+        Validating with the returned registry never has to retrieve a file,
+        whereas the shared registry retrieves them again on every validation.
+
+        Parameters
+        ----------
+        `schema` : :py:class:`dict`
+            The JSON schema whose references are retrieved.
+
+        Returns
+        -------
+        :class:`referencing.Registry`
+            A registry that contains every referenced schema file.
+        """
+        resources = {}
+        pending = [schema]
 
-        except jsonschema.ValidationError:
-            return False
+        while pending:
+            for uri in _find_refs(pending.pop()):
+                if uri not in resources:
+                    resources[uri] = cls.retrieve_schema_file(uri)
+                    pending.append(resources[uri].contents)
 
-    def write_input_file(self, input_dict: dict) -> None:
+        # Files that are still missing can be retrieved as a fallback.
+        return FileHandler._registry.with_resources(resources.items())
+
+    def write_input_file(
+        self,
+        input_dict: dict,
+        validated: bool = False
+    ) -> None:
         """Write a schema-valid Python dictionary into a input JSON file.
 
         The file must be in :attr:`INPUT_DIR`. The `input_dict` must
@@ -230,20 +696,52 @@ class FileHandler:
         ----------
         `input_dict` : :py:class:`dict`
             An object to write into the file as a JSON.
+        `validated` : `bool`, default=``False``
+            Whether `input_dict` has already been validated by
+            :meth:`validate_input_dict`. If ``True``, it is not validated a
+            second time.
+
+        Raises
+        ------
+        :exc:`ValueError`
+            If `input_dict` does not conform to the JSON schemas.
         """
-        self.validate_input_dict(input_dict)
-
-        # Write the object as a JSON into the input file
-        with self.INPUT_FILE_PATH.open('w+') as file:
-            json.dump(
-                input_dict,
-                file,
-                indent=4
+        if not validated and not self.validate_input_dict(input_dict):
+            raise ValueError(
+                'The input dictionary does not conform to the JSON schema.'
             )
 
+        # Serialize the object first so that it is written in a single call,
+        # and the file is closed as soon as it is written.
+        # Writing the encoded bytes skips the text layer of the file.
+        self.INPUT_FILE_PATH.write_bytes(
+            json.dumps(input_dict, indent=4).encode()
+        )
+
+    def get_json_template(self) -> typing.Any:
+        """Return a schema-valid dictionary of default values for
+        :attr:`SCHEMA`.
+
+        The template is only generated by :meth:`create_json_template` the
+        first time. Afterwards, a copy of the same template is returned.
+
+        Returns
+        -------
+        :py:class:`dict`
+            A :py:class:`dict` of default values that conforms to
+            :attr:`SCHEMA`.
+        """
+        if self.__json_template is None:
+            self.__json_template = self.create_json_template()
+
+        return copy.deepcopy(self.__json_template)
+
     def create_json_template(self, schema: dict | None = None) -> typing.Any:
-        """Recursively loop through the provided schema and generate a
-        schema-valid dictionary of default values.
+        """Loop through the provided schema and generate a schema-valid
+        dictionary of default values.
+
+        The schema is walked with an explicit stack rather than by recursion,
+        so deeply nested schemas do not approach the recursion limit.
 
         Parameters
         ----------
@@ -259,68 +757,97 @@ class FileHandler:
         # If no schema is passed in, default to self.json_schema.
         schema_dict = self.SCHEMA if schema is None else schema
 
-        # If the schema contains a subschema, open and read it.
-        if '$ref' in schema_dict:
-            with open(FileHandler.SCHEMA_DIR / schema_dict['$ref']) as file:
-                ref_schema = json.load(
-                    file
-                )
-            return self.create_json_template(ref_schema)
-
-        if 'default' in schema_dict:
-            return schema_dict['default']
-
-        # Else, generate a value of the appropriate type.
-        match schema_dict['type']:
-            case 'object':
-
-                # Recurse through the properties of the object.
-                return {
-                    property: self.create_json_template(
-                        schema_dict['properties'][property]
-                    )
-                    for property in schema_dict['properties']
-                }
-
-            case 'array':
-                # Create the array element to be copied.
-                array_element = self.create_json_template(schema_dict['items'])
-
-                # Add the minimum number of elements necessary.
-                if 'minItems' in schema_dict:
-                    return [
-                        array_element for i in range(schema_dict['minItems'])
-                    ]
-
-                else:
-                    return [array_element]
-
-            case 'string':
-                return ''
-
-            case 'number':
-                if 'minimum' in schema_dict:
-                    return schema_dict['minimum']
-
-                if 'exclusiveMinimum' in schema_dict:
-                    return schema_dict['exclusiveMinimum'] + 1.0
-
-                return 0.0
-
-            case 'integer':
-                if 'minimum' in schema_dict:
-                    return schema_dict['minimum']
+        # Each entry is the container to fill, the key or index to fill,
+        # and the subschema to generate the value from.
+        result: list[typing.Any] = [None]
+        stack: list[tuple[typing.Any, typing.Any, dict]] = [
+            (result, 0, schema_dict)
+        ]
+
+        # Arrays are filled with copies of their first element
+        # once every nested value has been generated.
+        arrays: list[tuple[list, int]] = []
+
+        while stack:
+            parent, key, schema_dict = stack.pop()
+
+            # If the schema contains a subschema, retrieve it.
+            # The subschema is only read from its file the first time.
+            while '$ref' in schema_dict:
+                schema_dict = self.retrieve_schema_file(
+                    schema_dict['$ref']
+                ).contents
+
+            if 'default' in schema_dict:
+                parent[key] = schema_dict['default']
+                continue
+
+            # Leaf types are generated by their factory in a single lookup.
+            schema_type = schema_dict.get('type')
+            if schema_type in _LEAF_FACTORIES:
+                parent[key] = _LEAF_FACTORIES[schema_type](schema_dict)
+                continue
+
+            # Else, generate a value of the appropriate type.
+            match schema_type:
+                case 'object':
+                    properties = schema_dict['properties']
+                    node = dict.fromkeys(properties)
+                    parent[key] = node
+
+                    # Push the properties in reverse so that they are
+                    # generated in the same order as they are declared.
+                    for property in reversed(properties):
+                        stack.append((node, property, properties[property]))
+
+                case 'array':
+                    # Create the array element to be copied.
+                    node = [None]
+                    parent[key] = node
+                    stack.append((node, 0, schema_dict['items']))
+
+                    # Add the minimum number of elements necessary.
+                    arrays.append((node, schema_dict.get('minItems', 1)))
+
+                case _:
+                    parent[key] = None
+
+        # Nested arrays are registered after the arrays that contain them,
+        # so fill them in reverse to copy complete elements.
+        for node, num_items in reversed(arrays):
+            array_element = node[0]
+
+            # Immutable elements can be shared between every index.
+            if not isinstance(array_element, (dict, list)):
+                node[:] = [array_element] * num_items
+                continue
+
+            # Elements that only contain immutable values can be copied
+            # shallowly. Otherwise, the whole element has to be copied.
+            values = (
+                array_element.values() if isinstance(array_element, dict)
+                else array_element
+            )
+            copy_element = (
+                copy.deepcopy
+                if any(isinstance(value, (dict, list)) for value in values)
+                else copy.copy
+            )
 
-                if 'exclusiveMinimum' in schema_dict:
-                    return schema_dict['exclusiveMinimum'] + 1
+            # The generated element is reused as the first item,
+            # unless the array may be empty.
+            node[1:] = [
+                copy_element(array_element) for i in range(num_items - 1)
+            ]
+            del node[num_items:]
 
-                return 0
+        return result[0]
 
-            case 'boolean':
-                return False
 
-            case _:
-                return None
+# Create registry that retrieves all necessary files.
+FileHandler._registry = referencing.Registry(
+    retrieve=FileHandler.retrieve_schema_file
+)
 
 
 # Generate a default blank template input file.
@@ -333,5 +860,5 @@ if __name__ == '__main__':
     # Create a file handler using the given JSON schema
     file_handler = FileHandler(input_filepath=sys.argv[1])
 
-    template_dict = file_handler.create_json_template()
+    template_dict = file_handler.get_json_template()
     file_handler.write_input_file(template_dict)
@@ -7,8 +7,11 @@ from pathlib import Path
 import sys
 import typing
 
+import ijson
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
+import scipy.constants
 
 import files
 import particles
@@ -16,6 +19,17 @@ import plot
 import vectors
 
 
+# The number of positions whose pairwise interactions are calculated at once
+# by `Simulation.calculate_direct_fields()`.
+_DIRECT_SUM_BLOCK_SIZE = 256
+
+# The line that `Simulation.get_particles_string()` writes for each particle,
+# which matches `particles.PointParticle.__str__()`.
+_PARTICLE_LINE_FORMAT = (
+    'r=(%s, %s, %s), v=<%s, %s, %s>, a=<%s, %s, %s>, m=%s, q=%s\n'
+)
+
+
 class Simulation:
     """One simulation of a given initial conditions of particles and fields.
 
@@ -40,6 +54,13 @@ class Simulation:
     `particles_list` : :class:`list` [:class:`particles.PointParticle`], default = ``[]``
         A :class:`list` of particles that are interacting with each other in the
         simulation.
+    `dtype` : :class:`numpy.typing.DTypeLike`, default=:type:`numpy.float64`
+        The data type used to store the positions and velocities of the
+        particles. The fields and forces are still calculated in double
+        precision, so a smaller type only affects the stored state.
+    `record_history` : `bool`, default=``True``
+        Whether to record the particles' states in :attr:`particles_data`
+        as the simulation runs.
 
     Attributes
     ----------
@@ -48,6 +69,34 @@ class Simulation:
         simulation.
     `particles_data` : :class:`pandas.DataFrame`
         A record of all the particles' states over the course of the simulation.
+        It is empty if :attr:`record_history` is ``False``.
+    `record_history` : `bool`
+        Whether the particles' states are recorded in :attr:`particles_data`
+        as the simulation runs.
+    `DTYPE` : :class:`numpy.dtype`
+        The data type of :attr:`positions` and :attr:`velocities`.
+    `positions` : :class:`numpy.ndarray`
+        An N × 3 array of the particles' current positions in meters (m).
+        The :attr:`~particles.PointParticle.position` of each particle in
+        :attr:`particles_list` is a view of its row.
+    `velocities` : :class:`numpy.ndarray`
+        An N × 3 array of the particles' current velocities in meters per
+        second (m/s). The :attr:`~particles.PointParticle.velocity` of each
+        particle is a view of its row.
+    `accelerations` : :class:`numpy.ndarray`
+        An N × 3 array of the particles' current accelerations in meters per
+        second squared (m/s^2). The
+        :attr:`~particles.PointParticle.acceleration` of each particle is a
+        view of its row.
+    `MASSES` : :class:`numpy.ndarray`
+        The masses of the particles in kilograms (kg).
+    `CHARGES` : :class:`numpy.ndarray`
+        The charges of the particles in coulombs (C).
+    `IDS` : :class:`numpy.ndarray`
+        The :attr:`~particles.PointParticle.ID` of each particle.
+    `INVERSE_MASSES` : :class:`numpy.ndarray`
+        An N × 1 array of the reciprocals of :attr:`MASSES`, in inverse
+        kilograms (1/kg).
     `gravitational_field` : :class:`vectors.FieldVector`
         A constant, uniform gravitational field.
     `electric_field` : :class:`vectors.FieldVector`
@@ -71,16 +120,61 @@ class Simulation:
         gravitational_field: vectors.FieldVector = np.zeros(3, dtype=float),
         electric_field: vectors.FieldVector = np.zeros(3, dtype=float),
         magnetic_field: vectors.FieldVector = np.zeros(3, dtype=float),
-        particles_list: list[particles.PointParticle] = []
+        particles_list: list[particles.PointParticle] = [],
+        dtype: npt.DTypeLike = np.float64,
+        record_history: bool = True
     ) -> None:
         self.particles_list = particles_list
+        self.DTYPE = np.dtype(dtype)
+
+        # Store the states of the particles as contiguous arrays,
+        # one row or element per particle.
+        self.positions = np.array(
+            [particle.position for particle in particles_list],
+            dtype=self.DTYPE
+        ).reshape(-1, 3)
+        self.velocities = np.array(
+            [particle.velocity for particle in particles_list],
+            dtype=self.DTYPE
+        ).reshape(-1, 3)
+        self.accelerations = np.array(
+            [particle.acceleration for particle in particles_list], dtype=float
+        ).reshape(-1, 3)
+        self.MASSES = np.array(
+            [particle.MASS for particle in particles_list], dtype=float
+        )
+        self.CHARGES = np.array(
+            [particle.CHARGE for particle in particles_list], dtype=float
+        )
+        self.IDS = np.array(
+            [particle.ID for particle in particles_list], dtype=int
+        )
 
-        self.particles_data = pd.DataFrame({
-            't': np.empty(0, dtype=float),
-            'x': np.empty(0, dtype=float),
-            'y': np.empty(0, dtype=float),
-            'z': np.empty(0, dtype=float)
-        })
+        # Multiplying by the inverse masses is cheaper than dividing by the
+        # masses, and they are reused by every stage of every time step.
+        self.INVERSE_MASSES = (1 / self.MASSES)[:, np.newaxis]
+
+        # Make the particles' vectors views of the arrays,
+        # so that they stay up to date as the arrays are updated.
+        for i, particle in enumerate(particles_list):
+            particle.position = self.positions[i]
+            particle.velocity = self.velocities[i]
+            particle.acceleration = self.accelerations[i]
+
+        # The accelerations and velocities estimated by each stage of the
+        # Runge-Kutta method, which are overwritten every time step.
+        self.__rk4_accelerations = np.empty((4, *self.positions.shape))
+        self.__rk4_velocities = np.empty((4, *self.velocities.shape))
+        # The position that each stage evaluates the acceleration at.
+        self.__rk4_positions = np.empty(self.positions.shape)
+
+        # The recorded states of the particles, one (t, x, y, z) row each.
+        # Only the first `self.__num_records` rows have been filled,
+        # and the data frame is only built from them when it is needed.
+        self.__records = np.empty((0, 4), dtype=float)
+        self.__num_records = 0
+        self.__particles_data: pd.DataFrame | None = None
+        self.record_history = record_history
 
         # Constant, universal fields.
         self.gravitational_field = gravitational_field
@@ -92,6 +186,46 @@ class Simulation:
 
         self.theta = theta
 
+    @property
+    def particles_data(self) -> pd.DataFrame:
+        """A record of all the particles' states over the course of the
+        simulation, with the columns t, x, y, and z.
+
+        Returns
+        -------
+        :class:`pandas.DataFrame`
+            The recorded states of the particles, in the order that they were
+            recorded.
+        """
+        if self.__particles_data is None:
+            self.__particles_data = pd.DataFrame(
+                self.__records[:self.__num_records],
+                columns=['t', 'x', 'y', 'z']
+            )
+
+        return self.__particles_data
+
+    def reserve_particle_data(self, num_records: int) -> None:
+        """Make room for at least `num_records` more records,
+        so that recording them does not have to reallocate the buffer.
+
+        Parameters
+        ----------
+        `num_records` : `int`
+            The number of particle states that are going to be recorded.
+        """
+        required_size = self.__num_records + num_records
+        if required_size <= len(self.__records):
+            return
+
+        # Grow geometrically, so that recording one state at a time
+        # still takes amortized constant time.
+        records = np.empty(
+            (max(required_size, 2 * len(self.__records)), 4), dtype=float
+        )
+        records[:self.__num_records] = self.__records[:self.__num_records]
+        self.__records = records
+
     def record_particle_data(self, particle: particles.PointParticle) -> None:
         """Save the state of a particle to the particles data.
 
@@ -100,175 +234,309 @@ class Simulation:
         `particle` : :class:`particles.PointParticle`
             A particle to save the state of.
         """
+        self.reserve_particle_data(1)
+
         # Save particle position data
-        new_data = pd.DataFrame([{
-            't': self.current_time_step * self.time_step_size,
-            'x': np.array((particle.position[0])),
-            'y': np.array((particle.position[1])),
-            'z': np.array((particle.position[2]))
-        }])
-        self.particles_data = pd.concat(
-            [self.particles_data, new_data], ignore_index=True)
+        record = self.__records[self.__num_records]
+        record[0] = self.current_time_step * self.time_step_size
+        record[1:] = particle.position
+
+        self.__num_records += 1
+        self.__particles_data = None
+
+    def record_particles_data(self) -> None:
+        """Save the states of all the particles to the particles data at once.
+        """
+        num_particles = len(self.particles_list)
+        self.reserve_particle_data(num_particles)
+
+        # Save particle position data
+        records = self.__records[
+            self.__num_records:self.__num_records + num_particles
+        ]
+        records[:, 0] = self.current_time_step * self.time_step_size
+        records[:, 1:] = self.positions
+
+        self.__num_records += num_particles
+        self.__particles_data = None
 
     def get_particles_string(self) -> str:
         """Return a string of the particles' current state.
 
+        Each particle is described on its own line,
+        in the same format as :meth:`particles.PointParticle.__str__`.
+
         Returns
         -------
         :py:class:`str`
             A string describing the state of all particles.
         """
+        # Convert every number to a string at once.
+        # NumPy converts them the same way as `str()` does.
+        columns = np.column_stack((
+            self.positions.astype(str),
+            self.velocities.astype(str),
+            self.accelerations.astype(str),
+            self.MASSES.astype(str),
+            self.CHARGES.astype(str)
+        ))
+
+        # Add the initial time and particle data to the file.
+        # Format all the lines with a single operation.
+        return (
+            f"t={self.current_time_step * self.time_step_size}\n"
+            + (_PARTICLE_LINE_FORMAT * len(columns))
+            % tuple(columns.ravel().tolist())
+            + '\n'
+        )
+
+    def calculate_direct_fields(
+        self,
+        positions: npt.NDArray[np.float64] | None = None,
+        velocities: npt.NDArray[np.float64] | None = None
+    ) -> tuple[
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64],
+        npt.NDArray[np.float64]
+    ]:
+        """Calculate the exact gravitational, electric, and magnetic fields
+        exerted at each particle by every other particle, by summing over
+        every pair of particles at once instead of walking a Barnes-Hut tree.
+
+        Parameters
+        ----------
+        `positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            An N × 3 array of hypothetical positions of the particles,
+            possibly different from their current positions. The particles
+            both exert the fields from and experience them at these positions.
+            If ``None``, defaults to :attr:`positions`.
+        `velocities` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            An N × 3 array of hypothetical velocities of the particles that
+            exert the magnetic fields, possibly different from their current
+            velocities. If ``None``, defaults to :attr:`velocities`.
 
-        # Add the initial time and particle data to the file
-        output_string = f"t={self.current_time_step * self.time_step_size}\n"
+        Returns
+        -------
+        ``tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.float64]]``
+            N × 3 arrays of the gravitational, electric, and magnetic fields at
+            each particle, respectively.
+        """
+        # The state may be stored in single precision,
+        # but the fields are always calculated in double precision.
+        positions = np.asarray(
+            self.positions if positions is None else positions, dtype=float
+        )
+        velocities = np.asarray(
+            self.velocities if velocities is None else velocities, dtype=float
+        )
 
-        for particle in self.particles_list:
-            output_string += particle.__str__() + '\n'
+        gravitational_fields = np.empty((len(positions), 3))
+        electric_fields = np.empty((len(positions), 3))
+        magnetic_fields = np.empty((len(positions), 3))
+
+        # The Coulomb constant.
+        k = 1 / (4 * np.pi * scipy.constants.epsilon_0)
+
+        # Calculate the fields for a block of positions at a time,
+        # so that the pairwise arrays stay small enough to fit in the cache.
+        for start in range(0, len(positions), _DIRECT_SUM_BLOCK_SIZE):
+            rows = slice(start, start + _DIRECT_SUM_BLOCK_SIZE)
+
+            # The displacement from each particle (column) to each position
+            # (row).
+            r = positions[rows, np.newaxis] - positions
+            squared_distance = np.einsum('ijk,ijk->ij', r, r)
+
+            # A particle exerts no field upon itself,
+            # nor upon points that overlap it.
+            block_indices = np.arange(len(r))
+            squared_distance[block_indices, start + block_indices] = 0.0
+            with np.errstate(divide='ignore'):
+                inverse_distance_cubed = np.where(
+                    squared_distance == 0, 0.0,
+                    squared_distance ** -1.5
+                )
 
-        output_string += '\n'
+            gravitational_fields[rows] = -scipy.constants.G * np.einsum(
+                'ij,ijk->ik', inverse_distance_cubed * self.MASSES, r
+            )
+            electric_fields[rows] = -k * np.einsum(
+                'ij,ijk->ik', inverse_distance_cubed * self.CHARGES, r
+            )
+            magnetic_fields[rows] = (
+                scipy.constants.mu_0 / (4 * np.pi) * np.einsum(
+                    'ij,ijk->ik',
+                    inverse_distance_cubed * self.CHARGES,
+                    np.cross(velocities, r)
+                )
+            )
 
-        return output_string
+        return gravitational_fields, electric_fields, magnetic_fields
 
-    def calculate_particle_force(
+    def calculate_forces(
         self,
-        particle: particles.PointParticle,
-        barnes_hut_root: particles.BarnesHutNode,
-        position: vectors.PositionVector | None = None,
-        velocity: vectors.VelocityVector | None = None
-    ) -> vectors.ForceVector:
-        """Calculate the force exerted on a particle by the fields and other
-        particles.
+        positions: npt.NDArray[np.float64] | None = None,
+        velocities: npt.NDArray[np.float64] | None = None,
+        out: npt.NDArray[np.float64] | None = None
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the forces exerted on every particle by the fields and
+        other particles all at once.
+
+        Every particle is at the given position and velocity, both where it
+        experiences the fields and where it exerts its own. If :attr:`theta`
+        is greater than 0, the fields of the particles are approximated with a
+        Barnes-Hut tree built from them. Otherwise, they are summed directly
+        with :meth:`calculate_direct_fields`.
 
         Parameters
         ----------
-        `particle` : :class:`particles.PointParticle`
-            The particle to calculate the force upon.
-        `barnes_hut_root` : :class:`particles.BarnesHutNode`
-            The Barnes-Hut tree that contains all the particles.
-        `position` : :class:`vectors.PositionVector`, optional
-            A hypothetical position of the particle to calculate with, possibly
-            different from its current position. If ``None``, defaults to
-            :attr:`particle.position <particles.PointParticle.position>`.
-        `velocity` : :class:`vectors.VelocityVector`, optional
-            A hypothetical velocity of the particle to calculate with, possibly
-            different from its current position. If ``None``, defaults to
-            :attr:`particle.velocity <particles.PointParticle.velocity>`.
+        `positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            An N × 3 array of hypothetical positions of the particles to
+            calculate with, possibly different from their current positions.
+            If ``None``, defaults to :attr:`positions`.
+        `velocities` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            An N × 3 array of hypothetical velocities of the particles to
+            calculate with, possibly different from their current velocities.
+            If ``None``, defaults to :attr:`velocities`.
+        `out` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            An N × 3 array to store the forces in, instead of allocating a new
+            one. If ``None``, a new array is allocated.
 
         Returns
         -------
-        :class:`vectors.ForceVector`
-            The force exerted on a particle by the fields and other particles.
+        :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An N × 3 array of the forces exerted on the particles by the fields
+            and other particles. This is `out` if it was given.
         """
-        if (position is None):
-            position = particle.position
+        # The state may be stored in single precision,
+        # but the fields are always calculated in double precision.
+        positions = np.asarray(
+            self.positions if positions is None else positions, dtype=float
+        )
+        velocities = np.asarray(
+            self.velocities if velocities is None else velocities, dtype=float
+        )
 
-        return (
-            particle.get_force_experienced(
-                barnes_hut_root.get_gravitational_field_exerted(
-                    position, self.theta, particle.ID
-                ),
-                barnes_hut_root.get_electric_field_exerted(
-                    position, self.theta, particle.ID),
-                barnes_hut_root.get_magnetic_field_exerted(
-                    position, self.theta, particle.ID),
-                velocity
+        # The fields at each particle from the other particles.
+        # When theta is 0, nothing would be approximated,
+        # so the fields are summed directly rather than through the tree.
+        if self.theta > 0:
+            # Generate the root node of the octree,
+            # with the particles at the given positions and velocities.
+            barnes_hut_root = particles.BarnesHutNode.from_arrays(
+                positions, velocities, self.MASSES, self.CHARGES, self.IDS
             )
-            + particle.get_force_experienced(
-                self.gravitational_field,
-                self.electric_field,
-                self.magnetic_field,
-                velocity
+            gravitational_fields, electric_fields, magnetic_fields = (
+                barnes_hut_root.get_fields_exerted(
+                    positions, self.theta, self.IDS
+                )
             )
-        )
 
-    def time_step(self) -> None:
-        """Run one time step of the simulation."""
-        # Generate the root node of the octree.
-        barnes_hut_root = particles.BarnesHutNode(self.particles_list)
-
-        # Stores the new positions and velocities.
-        new_data = np.zeros((len(particles_list), 2, 3))
-
-        # Update particle positions and velocities before calculating the forces.
-        for i in range(len(particles_list)):
-            particle = particles_list[i]
-
-            # Update particle acceleration.
-            particle.acceleration = self.calculate_particle_force(
-                particle, barnes_hut_root
-            ) / particle.MASS
-
-            # Record data after updating acceleration.
-            self.record_particle_data(particle)
-
-            # Use the classic Runge-Kutta method to to approximate velocity and position.
-            rk4_accelerations = np.zeros((4, 3))
-            rk4_velocities = np.zeros((4, 3))
-
-            rk4_accelerations[0] = particle.acceleration
-            rk4_velocities[0] = particle.velocity
-
-            rk4_accelerations[1] = self.calculate_particle_force(
-                particle, barnes_hut_root
-            ) / particle.MASS
-            rk4_velocities[1] = (particle.velocity
-                                 + rk4_accelerations[0] * self.time_step_size / 2)
-            position = (particle.position
-                        + rk4_velocities[0] * self.time_step_size / 2
-                        + 1/2 * rk4_accelerations[0] *
-                        (self.time_step_size / 2) ** 2
-                        )
-
-            rk4_accelerations[2] = self.calculate_particle_force(
-                particle, barnes_hut_root, position, rk4_velocities[1]
-            ) / particle.MASS
-            rk4_velocities[2] = (particle.velocity
-                                 + rk4_accelerations[1] * self.time_step_size / 2)
-            position = (particle.position
-                        + rk4_velocities[1] * self.time_step_size / 2
-                        + 1/2 * rk4_accelerations[1]
-                        * (self.time_step_size / 2) ** 2
-                        )
-
-            rk4_accelerations[3] = self.calculate_particle_force(
-                particle, barnes_hut_root, position, rk4_velocities[2]
-            ) / particle.MASS
-            rk4_velocities[3] = (particle.velocity
-                                 + rk4_accelerations[2] * self.time_step_size)
-            position = (particle.position
-                        + rk4_velocities[2] * self.time_step_size
-                        + 1/2 * rk4_accelerations[2] * self.time_step_size ** 2
-                        )
-
-            # Calculate the new velocity and position.
-            new_data[i, 0] = (
-                particle.position
-                + self.time_step_size / 6
-                * (
-                    rk4_velocities[0]
-                    + 2 * rk4_velocities[1]
-                    + 2 * rk4_velocities[2]
-                    + rk4_velocities[3]
-                )
+        else:
+            gravitational_fields, electric_fields, magnetic_fields = (
+                self.calculate_direct_fields(positions, velocities)
             )
-            new_data[i, 1] = (
-                particle.velocity
-                + self.time_step_size / 6
-                * (
-                    rk4_accelerations[0]
-                    + 2 * rk4_accelerations[1]
-                    + 2 * rk4_accelerations[2]
-                    + rk4_accelerations[3]
-                )
+
+        # Add the constant, uniform fields.
+        # They are 0 by default, in which case adding them would do nothing.
+        if np.any(self.gravitational_field):
+            gravitational_fields += self.gravitational_field
+
+        if np.any(self.electric_field):
+            electric_fields += self.electric_field
+
+        if np.any(self.magnetic_field):
+            magnetic_fields += self.magnetic_field
+
+        # F = m * g + q * (E + v × B),
+        # accumulated in place to avoid a temporary array for every term.
+        forces = np.empty((len(velocities), 3)) if out is None else out
+
+        # Write v × B one component at a time, since :func:`numpy.cross`
+        # can only return a new array.
+        products = np.empty(len(velocities))
+        for i, j, k in ((0, 1, 2), (1, 2, 0), (2, 0, 1)):
+            np.multiply(
+                velocities[:, j], magnetic_fields[:, k], out=forces[:, i]
             )
+            np.multiply(velocities[:, k], magnetic_fields[:, j], out=products)
+            forces[:, i] -= products
+
+        forces += electric_fields
+        forces *= self.CHARGES[:, np.newaxis]
+
+        gravitational_fields *= self.MASSES[:, np.newaxis]
+        forces += gravitational_fields
 
-        # Update the particle's position and velocity.
-        for i in range(len(particles_list)):
-            particle = particles_list[i]
+        return forces
 
-            # Update position, velocity, and acceleration.
-            particle.position = new_data[i, 0]
-            particle.velocity = new_data[i, 1]
+    def time_step(self) -> None:
+        """Run one time step of the simulation."""
+        # Record the positions before any of them are updated.
+        if self.record_history:
+            self.record_particles_data()
+
+        # The fractions of the time step that the stages advance by.
+        half_step = self.time_step_size / 2
+        sixth_step = self.time_step_size / 6
+
+        # Use the classic Runge-Kutta method to to approximate velocity and
+        # position, for every particle at once.
+        # Each stage evaluates the acceleration with every particle moved to
+        # the position and velocity estimated from the previous stage,
+        # so the particles exerting the fields move along with the ones
+        # experiencing them.
+        # Every stage is written into the preallocated buffers in place,
+        # so that no N × 3 temporaries are allocated per stage.
+        rk4_accelerations = self.__rk4_accelerations
+        rk4_velocities = self.__rk4_velocities
+        rk4_positions = self.__rk4_positions
+
+        # Update particle accelerations.
+        self.calculate_forces(out=rk4_accelerations[0])
+        rk4_accelerations[0] *= self.INVERSE_MASSES
+        self.accelerations[:] = rk4_accelerations[0]
+        rk4_velocities[0] = self.velocities
+
+        for stage, step in ((1, half_step), (2, half_step),
+                            (3, self.time_step_size)):
+            np.multiply(rk4_accelerations[stage - 1], step,
+                        out=rk4_velocities[stage])
+            rk4_velocities[stage] += self.velocities
+
+            np.multiply(rk4_velocities[stage - 1], step, out=rk4_positions)
+            rk4_positions += self.positions
+
+            self.calculate_forces(
+                rk4_positions,
+                rk4_velocities[stage],
+                out=rk4_accelerations[stage]
+            )
+            rk4_accelerations[stage] *= self.INVERSE_MASSES
+
+        # Calculate the new velocities and positions.
+        # The weighted sums are accumulated in double precision,
+        # and only rounded to `self.DTYPE` when they are added to the state.
+        # The particles' vectors are views of these arrays,
+        # so they are updated as well.
+        self.positions += (
+            sixth_step
+            * (
+                rk4_velocities[0]
+                + 2 * rk4_velocities[1]
+                + 2 * rk4_velocities[2]
+                + rk4_velocities[3]
+            )
+        )
+        self.velocities += (
+            sixth_step
+            * (
+                rk4_accelerations[0]
+                + 2 * rk4_accelerations[1]
+                + 2 * rk4_accelerations[2]
+                + rk4_accelerations[3]
+            )
+        )
 
         self.current_time_step += 1
 
@@ -292,24 +560,25 @@ class Simulation:
             Whether to print a progress report on how much of the simulation
             has been completed.
         """
-        # Stores the file output.
-        output_string = ''
-
         if file_handler is not None:
             # Clear the output and open it for further writing.
             file_handler.clear_output_file()
             file_handler.open_output_file()
 
             # Write constants to output file.
-            output_string += (f'theta={self.theta}')
-            output_string += (
-                f'g=<{", ".join((str(dimension) for dimension in self.gravitational_field))}>\n')
-            output_string += (
-                f'E=<{", ".join((str(dimension) for dimension in self.electric_field))}>\n')
-            output_string += (
-                f'B=<{", ".join((str(dimension) for dimension in self.magnetic_field))}>\n')
-            output_string += '\n'
-            file_handler.append_to_output_file(output_string)
+            file_handler.append_to_output_file(''.join((
+                f'theta={self.theta}',
+                f'g=<{", ".join((str(dimension) for dimension in self.gravitational_field))}>\n',
+                f'E=<{", ".join((str(dimension) for dimension in self.electric_field))}>\n',
+                f'B=<{", ".join((str(dimension) for dimension in self.magnetic_field))}>\n',
+                '\n'
+            )))
+
+        # Every particle is recorded once per time step and once at the end.
+        if self.record_history:
+            self.reserve_particle_data(
+                (int(num_time_steps) + 1) * len(self.particles_list)
+            )
 
         if print_progress:
             progress = 0.0
@@ -326,13 +595,17 @@ class Simulation:
                 self.time_step()
 
                 if print_progress:
-                    progress = (i + 1) / num_time_steps
-
-                    # Clear the previous line.
-                    sys.stdout.write('\033[K')
-                    # Print the current progress
-                    # and then return to the beginning of the line.
-                    print(f'Progress: {round(progress * 100, 1)}%', end='\r')
+                    # Only print the progress when the rounded percentage
+                    # changes, rather than writing to stdout every time step.
+                    new_progress = round((i + 1) / num_time_steps * 100, 1)
+                    if new_progress != progress:
+                        progress = new_progress
+
+                        # Clear the previous line.
+                        sys.stdout.write('\033[K')
+                        # Print the current progress
+                        # and then return to the beginning of the line.
+                        print(f'Progress: {progress}%', end='\r')
 
         except Exception as exception:
             # If an error occurs in the middle for unknown reasons, close the output file.
@@ -343,8 +616,8 @@ class Simulation:
 
         else:
             # Record final state of the particles.
-            for particle in particles_list:
-                self.record_particle_data(particle)
+            if self.record_history:
+                self.record_particles_data()
 
             # Write final particle states.
             if file_handler is not None:
@@ -357,7 +630,22 @@ class Simulation:
             print()
 
 
-if __name__ == '__main__':
+def main() -> None:
+    """Run and plot the simulation described by the input file whose path is
+    given as the first command-line argument.
+
+    Everything is kept in local variables rather than module globals, so that
+    :class:`Simulation` never depends on state that only exists when this
+    module is run as ``__main__``.
+
+    Raises
+    ------
+    :exc:`ValueError`
+        If no input file is given, or if it does not conform to the JSON
+        schema.
+    :exc:`OSError`
+        If the input file does not exist or is not properly formatted JSON.
+    """
     # Check if the user supplied a input file.
     if len(sys.argv) < 2:
         raise ValueError('Please enter the name of the input file.')
@@ -365,56 +653,83 @@ if __name__ == '__main__':
     # Read the input file data and create particles based on it.
 
     # Attempt to read the input file.
+    # The particles are streamed separately,
+    # so only the top-level properties are read here.
     try:
         file_handler = files.FileHandler(input_filepath=sys.argv[1])
+        input_metadata = file_handler.read_input_metadata()
 
-    except OSError:
+    except (OSError, ijson.JSONError):
         raise OSError(
             'The input file does not exist or does not contain a properly '
             'formatted JSON. Please correct it.'
         )
 
     # Check if the input file conforms to the schema.
-    if not file_handler.validate_input_dict(file_handler.INPUT_DATA):
+    if not file_handler.validate_input_dict(input_metadata):
         raise ValueError(
             'The input file contains a properly formatted JSON, '
             'but it does not conform to the JSON schema. Please correct it.'
         )
 
+    # The data type of the particles' positions and velocities.
+    dtype = files.FileHandler.PRECISION_DTYPES[
+        input_metadata.get('precision', 'double')
+    ]
+
     # Create a list of particles as described by the file data.
+    try:
+        particle_arrays = file_handler.read_particle_arrays(dtype=dtype)
+
+    except ValueError:
+        raise ValueError(
+            'The input file contains a properly formatted JSON, '
+            'but it does not conform to the JSON schema. Please correct it.'
+        )
+
     particles_list = [
         particles.PointParticle(
-            position=np.array(particle['position']),
-            velocity=np.array(particle['velocity']),
-            mass=particle['mass'],
-            charge=particle['charge']
+            position=position,
+            velocity=velocity,
+            mass=mass,
+            charge=charge
+        )
+        for position, velocity, mass, charge in zip(
+            particle_arrays['positions'],
+            particle_arrays['velocities'],
+            particle_arrays['masses'],
+            particle_arrays['charges']
         )
-        for particle in file_handler.INPUT_DATA['particles']
     ]
 
     # Create and run the simulation.
     simulation = Simulation(
-        theta=file_handler.INPUT_DATA['theta'],
-        time_step_size=file_handler.INPUT_DATA['time_step_size'],
+        theta=input_metadata['theta'],
+        time_step_size=input_metadata['time_step_size'],
         gravitational_field=np.array(
-            file_handler.INPUT_DATA['gravitational_field']),
-        electric_field=np.array(file_handler.INPUT_DATA['electric_field']),
-        magnetic_field=np.array(file_handler.INPUT_DATA['magnetic_field']),
-        particles_list=particles_list
+            input_metadata['gravitational_field']),
+        electric_field=np.array(input_metadata['electric_field']),
+        magnetic_field=np.array(input_metadata['magnetic_field']),
+        particles_list=particles_list,
+        dtype=dtype
     )
     simulation.run(
-        num_time_steps=file_handler.INPUT_DATA['num_time_steps'],
+        num_time_steps=input_metadata['num_time_steps'],
         file_handler=file_handler,
         print_progress=True
     )
 
     # Plot the simulation.
-    plot = plot.Plot(
+    simulation_plot = plot.Plot(
         data_frame=simulation.particles_data,
         time_step_size=simulation.time_step_size
     )
 
     input_path = Path(sys.argv[1])
-    plot.save_to_file(files.FileHandler.OUTPUT_DIR /
-                      (input_path.stem + ".gif"))
-    plot.show()
+    simulation_plot.save_to_file(files.FileHandler.OUTPUT_DIR /
+                                 (input_path.stem + ".gif"))
+    simulation_plot.show()
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,7 @@ particles treated as a single particle).
 
 
 from __future__ import annotations
+import functools
 import typing
 
 import numpy as np
@@ -96,21 +97,26 @@ class PointParticle:
         `point` : :class:`vectors.PositionVector`
             The coordinates of the point that this particle is exerting a
             gravitational field upon, in meters (m).
+            May also be an M × 3 array of points to calculate the field at
+            all at once.
 
         Returns
         -------
         :class:`vectors.FieldVector`
             The gravitational field generated at ``point`` in newtons per
-            kilogram (N/kg).
+            kilogram (N/kg), with the same shape as ``point``.
         """
         r = point - self.position
-        distance = np.linalg.norm(r)
+        squared_distance = np.sum(r * r, axis=-1, keepdims=True)
 
         # If the points are overlapping, there is no force.
-        if distance == 0:
-            return np.zeros(3, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse_distance_cubed = squared_distance ** -1.5
+            field = -r * (
+                scipy.constants.G * self.MASS * inverse_distance_cubed
+            )
 
-        return -r * scipy.constants.G * self.MASS / distance ** 3
+        return np.where(squared_distance == 0, 0.0, field)
 
     def get_gravitational_force_experienced(
         self,
@@ -143,24 +149,27 @@ class PointParticle:
         ----------
         `point` : :class:`vectors.PositionVector`
             The point to calculate the electric field at in meters (m).
+            May also be an M × 3 array of points to calculate the field at
+            all at once.
 
         Returns
         -------
         :class:`vectors.FieldVector`
             The electric field that this particle creates at the given point in
-            newtons per coulomb (N/C).
+            newtons per coulomb (N/C), with the same shape as ``point``.
         """
         r = point - self.position
-        distance = np.linalg.norm(r)
-
-        # If the points are overlapping, there is no force.
-        if distance == 0:
-            return np.zeros(3, dtype=float)
+        squared_distance = np.sum(r * r, axis=-1, keepdims=True)
 
         # The Coulomb constant
         k = 1 / (4 * np.pi * scipy.constants.epsilon_0)
 
-        return -r * k * self.CHARGE / distance ** 3
+        # If the points are overlapping, there is no force.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse_distance_cubed = squared_distance ** -1.5
+            field = -r * (k * self.CHARGE * inverse_distance_cubed)
+
+        return np.where(squared_distance == 0, 0.0, field)
 
     def get_electrostatic_force_experienced(
         self,
@@ -194,12 +203,14 @@ class PointParticle:
         ----------
         `point` : :class:`vectors.PositionVector`
             The point at which to calculate the magnetic field in meters (m).
+            May also be an M × 3 array of points to calculate the field at
+            all at once.
 
         Returns
         -------
         :class:`vectors.FieldVector`
             The magnetic field exerted by this particle at the given point in
-            teslas (T).
+            teslas (T), with the same shape as ``point``.
 
         Notes
         -----
@@ -208,16 +219,17 @@ class PointParticle:
         non-relativistic velocity.
         """
         r = point - self.position
-        distance = np.linalg.norm(r)
+        squared_distance = np.sum(r * r, axis=-1, keepdims=True)
 
         # If the points are overlapping, there is no force.
-        if distance == 0:
-            return np.zeros(3, dtype=float)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inverse_distance_cubed = squared_distance ** -1.5
+            field = np.cross(self.velocity, r) * (
+                scipy.constants.mu_0 / (4 * np.pi) * self.CHARGE
+                * inverse_distance_cubed
+            )
 
-        return (
-            scipy.constants.mu_0 * self.CHARGE * np.cross(self.velocity, r)
-            / (4 * np.pi * distance ** 3)
-        )
+        return np.where(squared_distance == 0, 0.0, field)
 
     def get_magnetic_force_experienced(
         self,
@@ -415,6 +427,8 @@ class BarnesHutNode:
         The distance from one side of the node to the other.
     `PARTICLES` : :class:`list` [:class:`particles.PointParticle`]
         A :class:`list` of all particles included in this node.
+        For a tree built with :meth:`from_arrays`, they are only created the
+        first time that they are accessed.
     `TOTAL_MASS` : float
         Total mass of all particles in this node in kilograms (kg).
     `CENTER_OF_MASS` : :class:`numpy.typing.NDArray`[:type:`numpy.float64`]
@@ -427,9 +441,10 @@ class BarnesHutNode:
         The velocity of the center of charge. In other words, a
         charge-weighted average of the velocities of particles in this
         node. Measured in meters per second (m/s).
-    `CHILD_NODES` : list[:class:`particles.BarnesHutNode`]
+    `CHILD_NODES` : tuple[:class:`particles.BarnesHutNode`, ...]
         The child nodes of this node. If this node is exterior, then the
-        :class:`list` will be empty. Otherwise, it will have eight children.
+        :class:`tuple` will be empty. Otherwise, it will have eight children.
+        They are only created the first time that they are accessed.
 
     References
     ----------
@@ -437,6 +452,14 @@ class BarnesHutNode:
        https://arborjs.org/docs/barnes-hut, (2011).
     """
 
+    # The maximum number of levels below the root node.
+    # Particles that are still together at this depth share a single node.
+    MAX_DEPTH = 21
+
+    # The number of points that :meth:`get_fields_exerted` walks the tree for
+    # at once.
+    TILE_SIZE = 256
+
     @staticmethod
     def cube_bounds(
         x_bounds: npt.NDArray[np.float64],
@@ -492,6 +515,59 @@ class BarnesHutNode:
 
         return new_bounds, centroid, size
 
+    @staticmethod
+    def morton_codes(
+        positions: npt.NDArray[np.float64],
+        lower_bounds: npt.NDArray[np.float64],
+        size: float
+    ) -> npt.NDArray[np.uint64]:
+        """Calculate the Morton code (i.e., Z-order curve index) of each
+        position within a cube.
+
+        The cube is divided into a grid of 2^21 cells along each dimension, and
+        the bits of the x, y, and z cell indices are interleaved, from the most
+        significant to the least. Every group of three bits is therefore the
+        octant that the position is in at one level of the octree, so sorting
+        positions by their Morton codes groups the positions in each octant
+        together, at every level.
+
+        Parameters
+        ----------
+        `positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An N × 3 array of positions within the cube.
+        `lower_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The lower x, y, and z bounds of the cube.
+        `size` : `float`
+            The distance from one side of the cube to the other.
+
+        Returns
+        -------
+        :class:`numpy.typing.NDArray` [:type:`numpy.uint64`]
+            The Morton code of each position.
+        """
+        # The number of cells along each dimension.
+        num_cells = 1 << BarnesHutNode.MAX_DEPTH
+
+        # Find the cell that each position is in.
+        # If the cube has no size, every position is in the same cell.
+        scale = num_cells / size if size > 0 else 0.0
+        cells = np.clip(
+            np.floor((positions - lower_bounds) * scale),
+            0, num_cells - 1
+        ).astype(np.uint64)
+
+        # Spread the bits of each cell index out so that there are two zero
+        # bits between each of them.
+        cells &= 0x1fffff
+        cells = (cells | cells << 32) & 0x1f00000000ffff
+        cells = (cells | cells << 16) & 0x1f0000ff0000ff
+        cells = (cells | cells << 8) & 0x100f00f00f00f00f
+        cells = (cells | cells << 4) & 0x10c30c30c30c30c3
+        cells = (cells | cells << 2) & 0x1249249249249249
+
+        # Interleave the x, y, and z bits, in that order.
+        return cells[:, 0] << 2 | cells[:, 1] << 1 | cells[:, 2]
+
     @typing.override
     def __init__(
         self,
@@ -500,59 +576,240 @@ class BarnesHutNode:
         y_bounds: npt.NDArray[np.float64] | None = None,
         z_bounds: npt.NDArray[np.float64] | None = None
     ):
-        # If `x_bounds` is not given,
-        # set it based on the minimum and maximum x positions of the particles.
-        # Else, set it to the given x bounds.
-        self.X_BOUNDS = (
-            np.array((
-                min(particles, key=lambda ele: ele.position[0]).position[0],
-                max(particles, key=lambda ele: ele.position[0]).position[0]
-            )) if x_bounds is None
-            else x_bounds
+        self.__build(
+            np.array(
+                [particle.position for particle in particles], dtype=float
+            ).reshape(-1, 3),
+            np.array(
+                [particle.velocity for particle in particles], dtype=float
+            ).reshape(-1, 3),
+            np.array([particle.MASS for particle in particles], dtype=float),
+            np.array([particle.CHARGE for particle in particles], dtype=float),
+            np.array([particle.ID for particle in particles], dtype=int),
+            x_bounds,
+            y_bounds,
+            z_bounds,
+            particles
         )
 
-        # If `y_bounds` is not given,
-        # set it based on the minimum and maximum y positions of the particles.
-        # Else, set it to the given y bounds.
-        self.Y_BOUNDS = (
-            np.array((
-                min(particles, key=lambda ele: ele.position[1]).position[1],
-                max(particles, key=lambda ele: ele.position[1]).position[1]
-            )) if y_bounds is None
-            else y_bounds
-        )
+    @classmethod
+    def from_arrays(
+        cls,
+        positions: npt.NDArray[np.float64],
+        velocities: npt.NDArray[np.float64],
+        masses: npt.NDArray[np.float64],
+        charges: npt.NDArray[np.float64],
+        ids: npt.NDArray[np.int_],
+        x_bounds: npt.NDArray[np.float64] | None = None,
+        y_bounds: npt.NDArray[np.float64] | None = None,
+        z_bounds: npt.NDArray[np.float64] | None = None
+    ) -> BarnesHutNode:
+        """Create a Barnes-Hut tree from arrays of the particles' properties
+        rather than from :class:`PointParticle` objects.
 
-        # If `y_bounds` is not given,
-        # set it based on the minimum and maximum y positions of the particles.
-        # Else, set it to the given z bounds.
-        self.Z_BOUNDS = (
-            np.array((
-                min(particles, key=lambda ele: ele.position[2]).position[2],
-                max(particles, key=lambda ele: ele.position[2]).position[2]
-            )) if z_bounds is None
-            else z_bounds
+        Useful for building a tree of the particles at hypothetical positions
+        and velocities, such as the stages of a Runge-Kutta method, without
+        moving the particles themselves.
+
+        Parameters
+        ----------
+        `positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An N × 3 array of the positions of the particles.
+        `velocities` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An N × 3 array of the velocities of the particles.
+        `masses` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The mass of each particle.
+        `charges` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The charge of each particle.
+        `ids` : :class:`numpy.typing.NDArray` [:type:`numpy.int_`]
+            The ID of each particle, which is excluded from the fields
+            calculated at the positions with the same ID.
+        `x_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            The lower and upper x bounds of the tree. If ``None``, they are
+            calculated from the positions, as in :class:`BarnesHutNode`.
+        `y_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            The lower and upper y bounds of the tree. If ``None``, they are
+            calculated from the positions, as in :class:`BarnesHutNode`.
+        `z_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`], optional
+            The lower and upper z bounds of the tree. If ``None``, they are
+            calculated from the positions, as in :class:`BarnesHutNode`.
+
+        Returns
+        -------
+        :class:`BarnesHutNode`
+            The root node of the tree.
+        """
+        root = cls.__new__(cls)
+        root.__build(
+            np.asarray(positions, dtype=float).reshape(-1, 3),
+            np.asarray(velocities, dtype=float).reshape(-1, 3),
+            np.asarray(masses, dtype=float),
+            np.asarray(charges, dtype=float),
+            np.asarray(ids, dtype=int),
+            x_bounds,
+            y_bounds,
+            z_bounds,
+            None
         )
 
-        # The centroid of the Barnes Hut node
-        centroid: npt.NDArray[np.float64]
+        return root
 
-        self.SIZE: float
+    def __build(
+        self,
+        positions: npt.NDArray[np.float64],
+        velocities: npt.NDArray[np.float64],
+        masses: npt.NDArray[np.float64],
+        charges: npt.NDArray[np.float64],
+        ids: npt.NDArray[np.int_],
+        x_bounds: npt.NDArray[np.float64] | None,
+        y_bounds: npt.NDArray[np.float64] | None,
+        z_bounds: npt.NDArray[np.float64] | None,
+        particles: list[PointParticle] | None
+    ) -> None:
+        """Set the bounds of this node as the root of a tree, and sort the
+        particles within them by their Morton codes.
+
+        Parameters
+        ----------
+        `positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An N × 3 array of the positions of the particles.
+        `velocities` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An N × 3 array of the velocities of the particles.
+        `masses` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The mass of each particle.
+        `charges` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The charge of each particle.
+        `ids` : :class:`numpy.typing.NDArray` [:type:`numpy.int_`]
+            The ID of each particle.
+        `x_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`] | ``None``
+            The lower and upper x bounds, or ``None`` to fit the particles.
+        `y_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`] | ``None``
+            The lower and upper y bounds, or ``None`` to fit the particles.
+        `z_bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`] | ``None``
+            The lower and upper z bounds, or ``None`` to fit the particles.
+        `particles` : `list` [:class:`PointParticle`] | ``None``
+            The particles that the arrays were taken from, or ``None`` if
+            there are none.
+        """
+        # Whether the x, y, and z bounds are fitted to the particles.
+        fitted = np.array((x_bounds is None, y_bounds is None, z_bounds is None))
+
+        # If any of the bounds are not given, set them based on the minimum
+        # and maximum positions of the particles.
+        # Else, set them to the given bounds.
+        if fitted.any():
+            lower_bounds = positions.min(axis=0)
+            upper_bounds = positions.max(axis=0)
+
+        x_bounds = (
+            np.array((lower_bounds[0], upper_bounds[0])) if x_bounds is None
+            else x_bounds
+        )
+        y_bounds = (
+            np.array((lower_bounds[1], upper_bounds[1])) if y_bounds is None
+            else y_bounds
+        )
+        z_bounds = (
+            np.array((lower_bounds[2], upper_bounds[2])) if z_bounds is None
+            else z_bounds
+        )
 
         # Make the bounds cubical if they are not.
-        bounds, centroid, self.SIZE = BarnesHutNode.cube_bounds(
-            self.X_BOUNDS,
-            self.Y_BOUNDS,
-            self.Z_BOUNDS
+        bounds, centroid, size = BarnesHutNode.cube_bounds(
+            x_bounds,
+            y_bounds,
+            z_bounds
+        )
+
+        # Only keep the particles that are within the bounds.
+        # Every particle is within the fitted bounds, even if recentering
+        # them on the centroid rounded the extreme particles just outside,
+        # and their Morton codes are clipped to the cube anyway.
+        within_bounds = np.flatnonzero(np.all(
+            fitted
+            | ((positions >= bounds[:, 0]) & (positions <= bounds[:, 1])),
+            axis=1
+        ))
+
+        # Sort the particles by their Morton codes,
+        # so that the particles in each child node are next to each other.
+        morton_codes = BarnesHutNode.morton_codes(
+            positions[within_bounds], bounds[:, 0], size
+        )
+        order = np.argsort(morton_codes, kind='stable')
+        indices = within_bounds[order]
+
+        self.__initialize(
+            positions[indices],
+            velocities[indices],
+            masses[indices],
+            charges[indices],
+            ids[indices],
+            None if particles is None else [particles[i] for i in indices],
+            morton_codes[order],
+            bounds,
+            size,
+            depth=0
         )
 
+    def __initialize(
+        self,
+        positions: npt.NDArray[np.float64],
+        velocities: npt.NDArray[np.float64],
+        masses: npt.NDArray[np.float64],
+        charges: npt.NDArray[np.float64],
+        ids: npt.NDArray[np.int_],
+        particles: list[PointParticle] | None,
+        morton_codes: npt.NDArray[np.uint64],
+        bounds: npt.NDArray[np.float64],
+        size: float,
+        depth: int
+    ) -> None:
+        """Set the attributes of this node.
+
+        Parameters
+        ----------
+        `positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The positions of the particles in this node, sorted by their Morton
+            codes.
+        `velocities` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The velocities of the particles in the same order.
+        `masses` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The masses of the particles in the same order.
+        `charges` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The charges of the particles in the same order.
+        `ids` : :class:`numpy.typing.NDArray` [:type:`numpy.int_`]
+            The IDs of the particles in the same order.
+        `particles` : `list` [:class:`PointParticle`] | ``None``
+            The particles themselves in the same order, or ``None`` to only
+            create them when :attr:`PARTICLES` is first accessed.
+        `morton_codes` : :class:`numpy.typing.NDArray` [:type:`numpy.uint64`]
+            The Morton codes of the particles, relative to the root node.
+        `bounds` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            A 3 × 2 array of the lower and upper x, y, and z bounds of this
+            node.
+        `size` : `float`
+            The distance from one side of this node to the other.
+        `depth` : `int`
+            The number of nodes above this node.
+        """
         self.X_BOUNDS, self.Y_BOUNDS, self.Z_BOUNDS = bounds
+        self.SIZE = size
+
+        self.__positions = positions
+        self.__velocities = velocities
+        self.__masses = masses
+        self.__charges = charges
+        self.__ids = ids
+        self.__particles = particles
+        self.__morton_codes = morton_codes
+        self.__depth = depth
 
-        self.PARTICLES = [
-            particle for particle in particles if self.particle_within_bounds(particle)]
+        # The centroid of the Barnes Hut node
+        centroid = np.mean(bounds, axis=1)
 
-        self.TOTAL_MASS = sum(particle.MASS for particle in self.PARTICLES)
-        mass_moment = sum(
-            particle.MASS * particle.position for particle in self.PARTICLES)
+        self.TOTAL_MASS = float(np.sum(masses))
+        mass_moment = masses @ positions
 
         # Divide the mass moment by center of mass to obtain the center of mass.
         # If mass is 0, return the centroid.
@@ -561,12 +818,8 @@ class BarnesHutNode:
             else centroid
         )
 
-        self.TOTAL_CHARGE = sum(
-            particle.CHARGE for particle in self.PARTICLES
-        )
-        charge_moment = sum(
-            particle.CHARGE * particle.position for particle in self.PARTICLES
-        )
+        self.TOTAL_CHARGE = float(np.sum(charges))
+        charge_moment = charges @ positions
 
         # Divide the charge moment by center of charge to obtain the center of charge.
         # If charge is 0, return the centroid.
@@ -577,24 +830,104 @@ class BarnesHutNode:
         # Completely made-up name.
         # q * v = q * d / t = q / t * d = I * d
         # Thus, moment of current.
-        current_moment = sum(
-            particle.CHARGE * particle.velocity for particle in self.PARTICLES
-        )
+        current_moment = charges @ velocities
 
         self.CENTER_OF_CHARGE_VELOCITY = (
             current_moment / self.TOTAL_CHARGE if self.TOTAL_CHARGE != 0
             else np.zeros(3, dtype=float)
         )
 
+    @functools.cached_property
+    def PARTICLES(self) -> list[PointParticle]:
+        """The particles in this node.
+
+        For a tree built with :meth:`from_arrays`, they are only created the
+        first time that they are accessed, with the positions, velocities,
+        masses, charges, and IDs that the tree was built from. Since they
+        share their IDs, they are equal to the particles that the arrays
+        describe.
+
+        Returns
+        -------
+        ``list[PointParticle]``
+            The particles in this node, in the order of their Morton codes.
+        """
+        if self.__particles is not None:
+            return self.__particles
+
+        particles = []
+        for position, velocity, mass, charge, particle_id in zip(
+            self.__positions,
+            self.__velocities,
+            self.__masses,
+            self.__charges,
+            self.__ids
+        ):
+            particle = PointParticle(
+                position=position.copy(),
+                velocity=velocity.copy(),
+                mass=float(mass),
+                charge=float(charge)
+            )
+            # Represent the same particle as the one that the arrays describe.
+            particle.ID = int(particle_id)
+            particles.append(particle)
+
+        return particles
+
+    @functools.cached_property
+    def CHILD_NODES(self) -> tuple[BarnesHutNode, ...]:
+        """The child nodes of this node.
+        They are only created the first time that they are accessed,
+        since :meth:`get_fields_exerted` does not need them.
+
+        Returns
+        -------
+        ``tuple[BarnesHutNode, ...]``
+            Eight child nodes if this node is internal, or none if it is
+            external.
+        """
         # Create child nodes if this node is an internal node
         # (i.e., it has more than 1 particle).
         # Create no children if this is an external node
-        # (i.e., it has only 0 or 1 particles).
-        self.CHILD_NODES = (
-            self.create_child_nodes() if len(self.PARTICLES) > 1 and self.SIZE > 0
+        # (i.e., it has only 0 or 1 particles),
+        # or if it is too small to be divided any further.
+        return (
+            self.create_child_nodes()
+            if self.__is_internal(
+                len(self.__masses), self.SIZE, self.__depth
+            )
             else ()
         )
 
+    @staticmethod
+    def __is_internal(
+        num_particles: npt.ArrayLike,
+        size: npt.ArrayLike,
+        depth: npt.ArrayLike
+    ) -> npt.ArrayLike:
+        """Return whether nodes with the given number of particles, size, and
+        depth are divided into child nodes.
+
+        Parameters
+        ----------
+        `num_particles` : :class:`numpy.typing.ArrayLike`
+            The number of particles in each node.
+        `size` : :class:`numpy.typing.ArrayLike`
+            The distance from one side of each node to the other.
+        `depth` : :class:`numpy.typing.ArrayLike`
+            The number of nodes above each node.
+
+        Returns
+        -------
+        :class:`numpy.typing.ArrayLike`
+            Whether each node is internal.
+        """
+        return (
+            (num_particles > 1) & (size > 0)
+            & (depth < BarnesHutNode.MAX_DEPTH)
+        )
+
     def create_child_nodes(self) -> tuple[BarnesHutNode]:
         """Recursively create child nodes for this Barnes-Hut node.
 
@@ -607,31 +940,49 @@ class BarnesHutNode:
         # Size of child nodes.
         child_size = self.SIZE / 2
 
-        # List of all the child nodes.
-        children = []
+        # The octant of each particle at this depth, which is sorted since the
+        # particles share every octant above this depth.
+        shift = 3 * (BarnesHutNode.MAX_DEPTH - 1 - self.__depth)
+        octants = (self.__morton_codes >> shift) & 0b111
 
-        # Split each dimension in half.
-        x_linspace = np.linspace(
-            self.X_BOUNDS[0], self.X_BOUNDS[1], num=2, endpoint=False
-        )
-        y_linspace = np.linspace(
-            self.Y_BOUNDS[0], self.Y_BOUNDS[1], num=2, endpoint=False
-        )
-        z_linspace = np.linspace(
-            self.Z_BOUNDS[0], self.Z_BOUNDS[1], num=2, endpoint=False
+        # Each octant's particles start where the previous octant's end.
+        starts = np.searchsorted(octants, np.arange(9, dtype=np.uint64))
+
+        lower_bounds = np.array(
+            (self.X_BOUNDS[0], self.Y_BOUNDS[0], self.Z_BOUNDS[0])
         )
 
-        # Loop eight times to create the octants.
-        for lower_x in x_linspace:
-            for lower_y in y_linspace:
-                for lower_z in z_linspace:
-                    child = BarnesHutNode(
-                        x_bounds=np.array((lower_x, lower_x + child_size)),
-                        y_bounds=np.array((lower_y, lower_y + child_size)),
-                        z_bounds=np.array((lower_z, lower_z + child_size)),
-                        particles=self.PARTICLES.copy(),
-                    )
-                    children.append(child)
+        # List of all the child nodes.
+        children = []
+
+        # Loop eight times to create the octants,
+        # in the order of their Morton codes.
+        for octant in range(8):
+            # The x, y, and z bits of the octant.
+            offsets = np.array(
+                ((octant >> 2) & 1, (octant >> 1) & 1, octant & 1)
+            )
+            child_lower_bounds = lower_bounds + offsets * child_size
+
+            indices = slice(starts[octant], starts[octant + 1])
+
+            child = BarnesHutNode.__new__(BarnesHutNode)
+            child.__initialize(
+                self.__positions[indices],
+                self.__velocities[indices],
+                self.__masses[indices],
+                self.__charges[indices],
+                self.__ids[indices],
+                self.PARTICLES[indices],
+                self.__morton_codes[indices],
+                np.stack(
+                    (child_lower_bounds, child_lower_bounds + child_size),
+                    axis=1
+                ),
+                child_size,
+                self.__depth + 1
+            )
+            children.append(child)
 
         return tuple(children)
 
@@ -673,7 +1024,8 @@ class BarnesHutNode:
         ----------
         `point` : :class:`vectors.PositionVector`
             The position to calculate the gravitational field at measured in
-            meters (m).
+            meters (m). May also be an M × 3 array of positions to calculate
+            the field at all at once.
 
         `theta` : `float`, default=0.0
             The value of theta, the Barnes-Hut approximation parameter being
@@ -687,43 +1039,64 @@ class BarnesHutNode:
             The ID of the particle to exclude from the force calculation.
 
             When the value is -1, no particles will be excluded from the force
-            calculation.
+            calculation. If `point` is an array of positions, it may also be
+            an array with one ID for each position.
 
         Returns
         -------
         :class:`vectors.FieldVector`
             The gravitational field produced by this node measured in
-            newtons per kg (N/kg).
+            newtons per kg (N/kg), with the same shape as `point`.
         """
-        # Calculate the displacement vector between the two points.
-        r = point - self.CENTER_OF_MASS
-        distance = np.linalg.norm(r)
-
-        # Prevent divide by 0 error.
-        if distance == 0:
-            return np.zeros(3, dtype=float)
+        # Work with an M × 3 array of points, even if only one point is given.
+        points = np.reshape(point, (-1, 3))
+        particle_ids = np.broadcast_to(particle_id, len(points))
+        force = np.zeros((len(points), 3))
+
+        # Calculate the displacement vectors between the points and the
+        # center of mass.
+        r = points - self.CENTER_OF_MASS
+        squared_distance = np.einsum('ij,ij->i', r, r)
+
+        # Points at a distance of 0 are skipped to prevent divide by 0 error.
+        # If a point is sufficiently far away, approximate the force.
+        far = (squared_distance != 0) & (
+            self.SIZE * self.SIZE < theta * theta * squared_distance
+        )
+        far_squared_distance = squared_distance[far, None]
+        force[far] = -r[far] * (
+            scipy.constants.G * self.TOTAL_MASS
+            * far_squared_distance ** -1.5
+        )
 
-        force = np.zeros(3)
+        # The points that are not sufficiently far away.
+        near = (squared_distance != 0) & ~far
+        if not near.any():
+            return force.reshape(np.shape(point))
 
-        # If the point is sufficiently far away, approximate the force.
-        if self.SIZE < theta * distance:
-            return -r * scipy.constants.G * self.TOTAL_MASS / distance ** 3
+        near_points = points[near]
+        near_particle_ids = particle_ids[near]
+        near_force = np.zeros((len(near_points), 3))
 
-        # If the point is not sufficiently far away,
+        # If the points are not sufficiently far away,
         # and this node is internal, add the force from each node.
         if len(self.CHILD_NODES) > 0:
             for child_node in self.CHILD_NODES:
-                force += child_node.get_gravitational_field_exerted(
-                    point, theta, particle_id)
+                near_force += child_node.get_gravitational_field_exerted(
+                    near_points, theta, near_particle_ids)
 
-        # If this the point is not sufficiently far away,
+        # If the points are not sufficiently far away,
         # and this node is external, add the force from each particle.
         else:
             for particle in self.PARTICLES:
-                if particle.ID != particle_id:
-                    force += particle.get_gravitational_field_exerted(point)
+                included = near_particle_ids != particle.ID
+                near_force[included] += particle.get_gravitational_field_exerted(
+                    near_points[included]
+                )
 
-        return force
+        force[near] = near_force
+
+        return force.reshape(np.shape(point))
 
     def get_electric_field_exerted(
         self,
@@ -738,7 +1111,8 @@ class BarnesHutNode:
         ----------
         `point` : :class:`vectors.PositionVector`
             The position to calculate the electric field at.
-            Measured in meters (m).
+            Measured in meters (m). May also be an M × 3 array of positions
+            to calculate the field at all at once.
         `theta` : `float`, default=0.0
             The value of theta, the Barnes-Hut approximation parameter being
             used. Given the distance between the point and the center of charge,
@@ -751,46 +1125,67 @@ class BarnesHutNode:
             The ID of the particle to exclude from the force calculation.
 
             When -1, no particles will be excluded from the force calculation.
+            If `point` is an array of positions, it may also be an array with
+            one ID for each position.
 
         Returns
         -------
         :class:`vectors.FieldVector`
             The electric field vector produced by this node measured in newtons
-            per coulomb (N/C).
+            per coulomb (N/C), with the same shape as `point`.
         """
-        # Calculate the displacement vector between the two points.
-        r = point - self.CENTER_OF_CHARGE
-        distance = np.linalg.norm(r)
-
-        # If the distance is 0, return a 0 array to avoid divide by 0.
-        if distance == 0:
-            return np.zeros(3, dtype=float)
-
-        force = np.zeros(3)
-
+        # Work with an M × 3 array of points, even if only one point is given.
+        points = np.reshape(point, (-1, 3))
+        particle_ids = np.broadcast_to(particle_id, len(points))
+        force = np.zeros((len(points), 3))
+
+        # Calculate the displacement vectors between the points and the
+        # center of charge.
+        r = points - self.CENTER_OF_CHARGE
+        squared_distance = np.einsum('ij,ij->i', r, r)
+
+        # Points at a distance of 0 are skipped to prevent divide by 0 error.
+        # If a point is sufficiently far away, approximate the force.
+        far = (squared_distance != 0) & (
+            self.SIZE * self.SIZE < theta * theta * squared_distance
+        )
         # The Coulomb constant.
         k = 1 / (4 * np.pi * scipy.constants.epsilon_0)
 
-        # If the point is sufficiently far away, approximate the force.
-        if self.SIZE < theta * distance:
-            # The electrostatic force between the particles.
-            return -r * k * self.TOTAL_CHARGE / distance ** 3
+        far_squared_distance = squared_distance[far, None]
+        force[far] = -r[far] * (
+            k * self.TOTAL_CHARGE
+            * far_squared_distance ** -1.5
+        )
+
+        # The points that are not sufficiently far away.
+        near = (squared_distance != 0) & ~far
+        if not near.any():
+            return force.reshape(np.shape(point))
 
-        # If the point is not sufficiently far away,
+        near_points = points[near]
+        near_particle_ids = particle_ids[near]
+        near_force = np.zeros((len(near_points), 3))
+
+        # If the points are not sufficiently far away,
         # and this node is internal, add the force from each node.
         if len(self.CHILD_NODES) > 0:
             for child_node in self.CHILD_NODES:
-                force += child_node.get_electric_field_exerted(
-                    point, theta, particle_id)
+                near_force += child_node.get_electric_field_exerted(
+                    near_points, theta, near_particle_ids)
 
-        # If this the point is not sufficiently far away,
+        # If the points are not sufficiently far away,
         # and this node is external, add the force from each particle.
         else:
             for particle in self.PARTICLES:
-                if particle.ID != particle_id:
-                    force += particle.get_electric_field_exerted(point)
+                included = near_particle_ids != particle.ID
+                near_force[included] += particle.get_electric_field_exerted(
+                    near_points[included]
+                )
+
+        force[near] = near_force
 
-        return force
+        return force.reshape(np.shape(point))
 
     def get_magnetic_field_exerted(
         self,
@@ -805,7 +1200,8 @@ class BarnesHutNode:
         ----------
         `point` : :class:`vectors.PositionVector`
             The point at which to calculate the magnetic field. Measured in
-            meters (m).
+            meters (m). May also be an M × 3 array of points to calculate the
+            field at all at once.
         `theta` : `float`, default=0.0
             The value of theta, the Barnes-Hut approximation parameter being
             used.
@@ -817,46 +1213,490 @@ class BarnesHutNode:
             The ID of the particle to exclude from the force calculation.
 
             When  -1, no particles will be excluded from the force calculation.
+            If `point` is an array of points, it may also be an array with
+            one ID for each point.
 
         Returns
         -------
         :class:`vectors.FieldVector`
-            The magnetic field produced by this node, measured in teslas (T).
+            The magnetic field produced by this node, measured in teslas (T),
+            with the same shape as `point`.
         """
-        # The vector between the positions of the particles.
-        r = point - self.CENTER_OF_CHARGE
-        # The distance between the particle and center of charge.
-        distance = np.linalg.norm(r)
-
-        # If the distance is 0, return 0 vector to avoid divide by 0.
-        if distance == 0:
-            return np.zeros(3, dtype=float)
+        # Work with an M × 3 array of points, even if only one point is given.
+        points = np.reshape(point, (-1, 3))
+        particle_ids = np.broadcast_to(particle_id, len(points))
+        force = np.zeros((len(points), 3))
+
+        # Calculate the displacement vectors between the points and the
+        # center of charge.
+        r = points - self.CENTER_OF_CHARGE
+        squared_distance = np.einsum('ij,ij->i', r, r)
+
+        # Points at a distance of 0 are skipped to prevent divide by 0 error.
+        # If a point is sufficiently far away, approximate the force.
+        far = (squared_distance != 0) & (
+            self.SIZE * self.SIZE < theta * theta * squared_distance
+        )
+        far_squared_distance = squared_distance[far, None]
+        force[far] = np.cross(self.CENTER_OF_CHARGE_VELOCITY, r[far]) * (
+            scipy.constants.mu_0 / (4 * np.pi) * self.TOTAL_CHARGE
+            * far_squared_distance ** -1.5
+        )
 
-        force = np.zeros(3)
+        # The points that are not sufficiently far away.
+        near = (squared_distance != 0) & ~far
+        if not near.any():
+            return force.reshape(np.shape(point))
 
-        # If the point is sufficiently far away, approximate the force.
-        if self.SIZE < theta * distance:
-            return (
-                scipy.constants.mu_0 * self.TOTAL_CHARGE
-                * np.cross(self.CENTER_OF_CHARGE_VELOCITY, r)
-                / (4 * np.pi * distance ** 3)
-            )
+        near_points = points[near]
+        near_particle_ids = particle_ids[near]
+        near_force = np.zeros((len(near_points), 3))
 
-        # If the point is not sufficiently far away,
+        # If the points are not sufficiently far away,
         # and this node is internal, add the force from each node.
         if len(self.CHILD_NODES) > 0:
             for child_node in self.CHILD_NODES:
-                force += child_node.get_magnetic_field_exerted(
-                    point, theta, particle_id)
+                near_force += child_node.get_magnetic_field_exerted(
+                    near_points, theta, near_particle_ids)
 
-        # If this the point is not sufficiently far away,
+        # If the points are not sufficiently far away,
         # and this node is external, add the force from each particle.
         else:
             for particle in self.PARTICLES:
-                if particle.ID != particle_id:
-                    force += particle.get_magnetic_field_exerted(point)
+                included = near_particle_ids != particle.ID
+                near_force[included] += particle.get_magnetic_field_exerted(
+                    near_points[included]
+                )
+
+        force[near] = near_force
+
+        return force.reshape(np.shape(point))
+
+    def get_fields_exerted(
+        self,
+        point: vectors.PositionVector,
+        theta: float = 0.0,
+        particle_id: int = -1
+    ) -> tuple[vectors.FieldVector, vectors.FieldVector, vectors.FieldVector]:
+        """Calculate the approximate gravitational, electric, and magnetic
+        fields exerted by this node at a given point, all in a single walk of
+        the tree.
+
+        Equivalent to calling :meth:`get_gravitational_field_exerted`,
+        :meth:`get_electric_field_exerted`, and
+        :meth:`get_magnetic_field_exerted` separately.
+
+        Parameters
+        ----------
+        `point` : :class:`vectors.PositionVector`
+            The position to calculate the fields at, measured in meters (m).
+            May also be an M × 3 array of positions to calculate the fields at
+            all at once.
+        `theta` : `float`, default=0.0
+            The value of theta, the Barnes-Hut approximation parameter being
+            used. When 0.0, no approximation will occur.
+        `particle_id` : `int`, default=-1
+            The ID of the particle to exclude from the force calculation.
+
+            When -1, no particles will be excluded from the force calculation.
+            If `point` is an array of positions, it may also be an array with
+            one ID for each position.
+
+        Returns
+        -------
+        ``tuple[vectors.FieldVector, vectors.FieldVector, vectors.FieldVector]``
+            The gravitational field in newtons per kilogram (N/kg),
+            the electric field in newtons per coulomb (N/C),
+            and the magnetic field in teslas (T), respectively,
+            each with the same shape as `point`.
+        """
+        # Work with an M × 3 array of points, even if only one point is given.
+        points = np.reshape(point, (-1, 3))
+        particle_ids = np.broadcast_to(particle_id, len(points))
+
+        # The gravitational, electric, and magnetic fields at each point.
+        fields = np.zeros((3, len(points), 3))
+
+        # Walk the tree for a tile of nearby points at a time, so that the
+        # arrays of each level stay small enough to fit in the cache.
+        # Sorting the points by their Morton codes keeps each tile compact,
+        # so its points mostly visit the same nodes.
+        order = np.argsort(
+            BarnesHutNode.morton_codes(
+                points,
+                np.array((self.X_BOUNDS[0], self.Y_BOUNDS[0], self.Z_BOUNDS[0])),
+                self.SIZE
+            ),
+            kind='stable'
+        )
+        for start in range(0, len(points), BarnesHutNode.TILE_SIZE):
+            tile = order[start:start + BarnesHutNode.TILE_SIZE]
+            fields[:, tile] = self.__get_tile_fields_exerted(
+                points[tile], theta, particle_ids[tile]
+            )
+
+        gravitational_field, electric_field, magnetic_field = (
+            field.reshape(np.shape(point)) for field in fields
+        )
+
+        return gravitational_field, electric_field, magnetic_field
+
+    def __get_tile_fields_exerted(
+        self,
+        points: npt.NDArray[np.float64],
+        theta: float,
+        particle_ids: npt.NDArray[np.int_]
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the gravitational, electric, and magnetic fields exerted
+        by this node at a tile of points by walking the flattened tree.
+
+        Parameters
+        ----------
+        `points` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An M × 3 array of the positions to calculate the fields at.
+        `theta` : `float`
+            The Barnes-Hut approximation parameter.
+        `particle_ids` : :class:`numpy.typing.NDArray` [:type:`numpy.int_`]
+            The ID of the particle to exclude at each position.
+
+        Returns
+        -------
+        :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            A 3 × M × 3 array of the gravitational, electric, and magnetic
+            fields at each position, respectively.
+        """
+        fields = np.zeros((3, len(points), 3))
+
+        flat_tree = self.__flat_tree
+
+        # Sum the gravitational field of every node or particle that the walk
+        # reaches, whether it is approximated or not.
+        mass_positions = flat_tree['mass_positions']
+        gravitational_strengths = flat_tree['gravitational_strengths']
+        for point_indices, source_indices in self.__iter_interactions(
+            points, theta, particle_ids, mass_positions
+        ):
+            r = points[point_indices] - mass_positions[source_indices]
+            np.add.at(
+                fields[0], point_indices,
+                -r * (
+                    gravitational_strengths[source_indices]
+                    * BarnesHutNode.__inverse_distance_cubed(r)
+                )[:, np.newaxis]
+            )
+
+        # Likewise for the electric and magnetic fields and the centers of
+        # charge.
+        charge_positions = flat_tree['charge_positions']
+        electric_strengths = flat_tree['electric_strengths']
+        magnetic_strengths = flat_tree['magnetic_strengths']
+        charge_velocities = flat_tree['charge_velocities']
+        for point_indices, source_indices in self.__iter_interactions(
+            points, theta, particle_ids, charge_positions
+        ):
+            r = points[point_indices] - charge_positions[source_indices]
+            inverse_distance_cubed = BarnesHutNode.__inverse_distance_cubed(r)
+            np.add.at(
+                fields[1], point_indices,
+                -r * (
+                    electric_strengths[source_indices]
+                    * inverse_distance_cubed
+                )[:, np.newaxis]
+            )
+            np.add.at(
+                fields[2], point_indices,
+                np.cross(charge_velocities[source_indices], r) * (
+                    magnetic_strengths[source_indices]
+                    * inverse_distance_cubed
+                )[:, np.newaxis]
+            )
+
+        return fields
+
+    @staticmethod
+    def __inverse_distance_cubed(
+        r: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Calculate 1 / |r|^3 for each displacement vector, or 0 for those
+        that have a length of 0.
+
+        Parameters
+        ----------
+        `r` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An M × 3 array of displacement vectors.
+
+        Returns
+        -------
+        :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The inverse cubed length of each displacement vector.
+        """
+        squared_distance = np.einsum('ij,ij->i', r, r)
+
+        # If the points are overlapping, there is no force.
+        with np.errstate(divide='ignore'):
+            return np.where(
+                squared_distance == 0, 0.0,
+                squared_distance ** -1.5
+            )
+
+    @functools.cached_property
+    def __flat_tree(self) -> dict[str, npt.NDArray]:
+        """The subtree under this node packed into flat arrays, so that it can
+        be walked with vectorized operations instead of a Python call per node.
+
+        The subtree is built one level at a time from the Morton codes of the
+        particles, without creating any :class:`BarnesHutNode` objects.
+        The nodes are numbered in breadth-first order, with this node as
+        node 0. The sources of the fields are numbered after them: first
+        every node, then every particle, in the order of their Morton codes.
+
+        Returns
+        -------
+        ``dict[str, npt.NDArray]``
+            The arrays that make up the flattened tree, by name.
+        """
+        positions = self.__positions
+        velocities = self.__velocities
+        masses = self.__masses
+        charges = self.__charges
+
+        # The properties of the nodes on each level.
+        # Each node contains a contiguous range of the particles.
+        level_starts = [np.zeros(1, dtype=np.intp)]
+        level_counts = [np.array([len(masses)], dtype=np.intp)]
+        level_lower_bounds = [np.array(
+            [(self.X_BOUNDS[0], self.Y_BOUNDS[0], self.Z_BOUNDS[0])],
+            dtype=float
+        )]
+        level_sizes = [np.full(1, self.SIZE, dtype=float)]
+        level_internal = []
+
+        # The index of the parent and the octant of each node below this one.
+        parents = []
+        octants = []
+
+        depth = self.__depth
+        num_nodes = 1
+        while True:
+            starts = level_starts[-1]
+            counts = level_counts[-1]
+            size = level_sizes[-1][0]
+
+            internal = self.__is_internal(counts, size, depth)
+            level_internal.append(internal)
+            if not internal.any():
+                break
+
+            # The particles in the internal nodes, in order.
+            counts = counts[internal]
+            particle_indices = (
+                np.repeat(starts[internal] - np.cumsum(counts) + counts, counts)
+                + np.arange(counts.sum())
+            )
+
+            # The particles of each child node are the consecutive particles
+            # of the same parent that share a Morton code prefix.
+            shift = 3 * (BarnesHutNode.MAX_DEPTH - 1 - depth)
+            prefixes = self.__morton_codes[particle_indices] >> shift
+            first = np.ones(len(particle_indices), dtype=bool)
+            first[1:] = prefixes[1:] != prefixes[:-1]
+            first_indices = np.flatnonzero(first)
+
+            child_parents = (
+                num_nodes - len(starts)
+                + np.repeat(np.flatnonzero(internal), counts)[first_indices]
+            )
+            child_octants = (prefixes[first_indices] & 0b111).astype(np.intp)
+
+            # The x, y, and z bits of the octant of each child.
+            offsets = np.stack(
+                (
+                    (child_octants >> 2) & 1,
+                    (child_octants >> 1) & 1,
+                    child_octants & 1
+                ),
+                axis=1
+            )
+
+            level_starts.append(particle_indices[first_indices])
+            level_counts.append(
+                np.diff(np.append(first_indices, len(particle_indices)))
+            )
+            level_lower_bounds.append(
+                level_lower_bounds[-1][child_parents - num_nodes + len(starts)]
+                + offsets * (size / 2)
+            )
+            level_sizes.append(np.full(len(first_indices), size / 2))
+            parents.append(child_parents)
+            octants.append(child_octants)
+
+            depth += 1
+            num_nodes += len(first_indices)
+
+        starts = np.concatenate(level_starts)
+        counts = np.concatenate(level_counts)
+        ends = starts + counts
+        lower_bounds = np.concatenate(level_lower_bounds)
+        sizes = np.concatenate(level_sizes)
+
+        children = np.full((num_nodes, 8), -1, dtype=np.intp)
+        if parents:
+            children[np.concatenate(parents), np.concatenate(octants)] = (
+                np.arange(1, num_nodes)
+            )
+
+        def sum_ranges(values: npt.NDArray[np.float64]) -> npt.NDArray:
+            """Sum `values` over the range of particles of each node."""
+            padded = np.concatenate((values, np.zeros((1, *values.shape[1:]))))
+            return np.add.reduceat(
+                padded, np.stack((starts, ends), axis=1).ravel(), axis=0
+            )[::2]
+
+        # The centroid of each node.
+        centroids = (lower_bounds + (lower_bounds + sizes[:, np.newaxis])) / 2
+
+        total_masses = sum_ranges(masses)
+        mass_moments = sum_ranges(masses[:, np.newaxis] * positions)
+
+        # Divide the mass moment by the total mass to obtain the center of
+        # mass. If mass is 0, use the centroid.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centers_of_mass = np.where(
+                total_masses[:, np.newaxis] != 0,
+                mass_moments / total_masses[:, np.newaxis],
+                centroids
+            )
+
+        total_charges = sum_ranges(charges)
+        charge_moments = sum_ranges(charges[:, np.newaxis] * positions)
+        current_moments = sum_ranges(charges[:, np.newaxis] * velocities)
+
+        # Likewise for the center of charge and its velocity.
+        # If charge is 0, use the origin.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            centers_of_charge = np.where(
+                total_charges[:, np.newaxis] != 0,
+                charge_moments / total_charges[:, np.newaxis],
+                0.0
+            )
+            center_of_charge_velocities = np.where(
+                total_charges[:, np.newaxis] != 0,
+                current_moments / total_charges[:, np.newaxis],
+                0.0
+            )
+
+        # The constants that the fields of each source are proportional to,
+        # multiplied in once here instead of on every interaction.
+        source_charges = np.concatenate((total_charges, charges))
+        # The Coulomb constant.
+        k = 1 / (4 * np.pi * scipy.constants.epsilon_0)
+
+        return {
+            'children': children,
+            'is_leaf': ~np.concatenate(level_internal),
+            'sizes': sizes,
+            'particle_starts': starts,
+            'particle_counts': counts,
+            'particle_ids': self.__ids,
+            'mass_positions': np.concatenate((centers_of_mass, positions)),
+            'gravitational_strengths': (
+                scipy.constants.G * np.concatenate((total_masses, masses))
+            ),
+            'charge_positions': np.concatenate((centers_of_charge, positions)),
+            'electric_strengths': k * source_charges,
+            'magnetic_strengths': (
+                scipy.constants.mu_0 / (4 * np.pi) * source_charges
+            ),
+            'charge_velocities': np.concatenate(
+                (center_of_charge_velocities, velocities)
+            ),
+        }
+
+    def __iter_interactions(
+        self,
+        points: npt.NDArray[np.float64],
+        theta: float,
+        particle_ids: npt.NDArray[np.int_],
+        source_positions: npt.NDArray[np.float64]
+    ) -> typing.Iterator[tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]]:
+        """Walk the flattened tree one level at a time for every point at once,
+        and yield the sources that exert a field upon each point.
+
+        Parameters
+        ----------
+        `points` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            An M × 3 array of all the positions being calculated at.
+        `theta` : `float`
+            The Barnes-Hut approximation parameter.
+        `particle_ids` : :class:`numpy.typing.NDArray` [:type:`numpy.int_`]
+            The ID of the particle to exclude at each position.
+        `source_positions` : :class:`numpy.typing.NDArray` [:type:`numpy.float64`]
+            The positions of the sources, i.e., either the centers of mass or
+            the centers of charge of the nodes, followed by the positions of
+            the particles.
+
+        Yields
+        ------
+        ``tuple[npt.NDArray[np.intp], npt.NDArray[np.intp]]``
+            The indices of the points and of the sources that exert a field
+            upon them, one pair of elements per interaction.
+        """
+        flat_tree = self.__flat_tree
+        children = flat_tree['children']
+        is_leaf = flat_tree['is_leaf']
+        squared_sizes = flat_tree['sizes'] ** 2
+        particle_starts = flat_tree['particle_starts']
+        particle_counts = flat_tree['particle_counts']
+        source_ids = flat_tree['particle_ids']
+        num_nodes = len(children)
+
+        # Every point starts at this node.
+        point_indices = np.arange(len(points))
+        node_indices = np.zeros(len(points), dtype=np.intp)
+
+        while len(point_indices) > 0:
+            r = points[point_indices] - source_positions[node_indices]
+            squared_distance = np.einsum('ij,ij->i', r, r)
+
+            # Approximate the nodes that are sufficiently far away.
+            # Points at a distance of 0 are skipped to prevent divide by 0
+            # error.
+            far = (squared_distance != 0) & (
+                squared_sizes[node_indices] < theta * theta * squared_distance
+            )
+            yield point_indices[far], node_indices[far]
+
+            near = (squared_distance != 0) & ~far
+            point_indices = point_indices[near]
+            node_indices = node_indices[near]
+
+            # Pair the points with each particle in the leaves that are near,
+            # except for the particle that is being calculated for.
+            leaf = is_leaf[node_indices]
+            counts = particle_counts[node_indices[leaf]]
+            leaf_point_indices = np.repeat(point_indices[leaf], counts)
+            particle_indices = (
+                np.repeat(
+                    particle_starts[node_indices[leaf]] - np.cumsum(counts)
+                    + counts,
+                    counts
+                )
+                + np.arange(counts.sum())
+            )
+            included = (
+                particle_ids[leaf_point_indices] != source_ids[particle_indices]
+            )
+            yield (
+                leaf_point_indices[included],
+                num_nodes + particle_indices[included]
+            )
 
-        return force
+            # Descend into the children of the internal nodes that are near.
+            child_indices = children[node_indices[~leaf]].ravel()
+            point_indices = np.repeat(
+                point_indices[~leaf], children.shape[1]
+            )[child_indices >= 0]
+            node_indices = child_indices[child_indices >= 0]
 
     def get_height(self) -> int:
         """Return the height of the tree under this Barnes-Hut node.